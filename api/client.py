@@ -11,7 +11,7 @@ import logging
 import random
 import re
 import time
-from typing import Dict, List, Optional, Any, Union, Tuple, TypeVar, Type, cast
+from typing import AsyncIterator, Dict, List, Optional, Any, Union, Tuple, TypeVar, Type, cast
 
 import aiohttp
 from aiohttp import BasicAuth
@@ -22,8 +22,12 @@ from riptidal.api.models import (
     SearchResult, Lyrics, LoginKey, ResourceType, StreamQuality, VideoQuality
 )
 from riptidal.api.keys import get_key, is_key_valid, get_all_keys
+from riptidal.api.rate_limit import AdaptiveRateGate
+from riptidal.api.response_cache import ResponseCache
+from riptidal.api.session import create_session
 from riptidal.core.settings import Settings
 from riptidal.utils.logger import get_logger
+from riptidal.utils.paths import get_cache_dir
 
 T = TypeVar('T', bound=BaseModel)
 
@@ -76,7 +80,7 @@ class TidalClient:
         }
         
         self.logger.info(f"Using API key: {key_data['platform']} - {key_data['formats']}")
-        if key_data['valid'] != 'True':
+        if not key_data['valid_bool']:
             self.logger.warning(f"Selected API key is marked as invalid. This may cause issues.")
         
         self.login_key = LoginKey()
@@ -89,11 +93,20 @@ class TidalClient:
         self.base_url = "https://api.tidalhifi.com/v1/"
         self.auth_url = "https://auth.tidal.com/v1/oauth2"
         self.session: Optional[aiohttp.ClientSession] = None
+        # Shared across all requests; adapts to 429/503 responses
+        self.rate_gate = AdaptiveRateGate(max_rate=settings.api_rate_limit)
+        # Disk cache for search responses, reused across runs
+        self.search_cache: Optional[ResponseCache] = None
+        if settings.response_cache_enabled:
+            self.search_cache = ResponseCache(
+                get_cache_dir() / "tidal_search.sqlite",
+                expire_after=settings.search_cache_days * 86400
+            )
     
     async def __aenter__(self):
         """Context manager entry."""
         if self.session is None:
-            self.session = aiohttp.ClientSession()
+            self.session = create_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -106,11 +119,13 @@ class TidalClient:
             self.logger.debug("Explicitly closing TidalClient session")
             await self.session.close()
             self.session = None
+        if self.search_cache:
+            self.search_cache.close()
     
     def _get_session(self) -> aiohttp.ClientSession:
         """Get the current session or create a new one."""
         if self.session is None:
-            self.session = aiohttp.ClientSession()
+            self.session = create_session()
         return self.session
     
     async def _request(
@@ -211,11 +226,12 @@ class TidalClient:
                 else:
                     request_kwargs["json"] = data
             
+            await self.rate_gate.acquire()
             async with session.request(**request_kwargs) as response:
                 self.logger.debug(f"Response status: {response.status}")
                 self.logger.debug(f"Response headers: {dict(response.headers)}")
                 
-                if response.status == 429:
+                if response.status in (429, 503):
                     retry_after = response.headers.get('Retry-After')
                     if retry_after:
                         try:
@@ -234,11 +250,13 @@ class TidalClient:
                     else:
                         self.logger.warning(f"Rate limited. Waiting {wait_time:.1f} seconds (attempt {retry_count+1}/{self.settings.retry_attempts})...")
                     
+                    self.rate_gate.penalize(wait_time)
                     await asyncio.sleep(wait_time)
                     return await self._request(
                         method, endpoint, params, data, headers, auth, base_url, retry_count + 1, use_form_data
                     )
                 
+                self.rate_gate.reward()
                 response_text = await response.text()
                 self.logger.debug(f"Response text: {response_text[:500]}")
                 
@@ -333,13 +351,35 @@ class TidalClient:
         Returns:
             List of items
         """
+        items = []
+        async for batch_items in self._iter_item_pages(endpoint, params, **kwargs):
+            items.extend(batch_items)
+        return items
+    
+    async def _iter_item_pages(
+        self, 
+        endpoint: str, 
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Iterate over pages of items from the Tidal API as they arrive.
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            **kwargs: Additional arguments for _request
+            
+        Yields:
+            List of items for each page
+        """
         if params is None:
             params = {}
         
         params['limit'] = 50
         params['offset'] = 0
         
-        items = []
+        collected = 0
         total = None
         
         while True:
@@ -354,10 +394,12 @@ class TidalClient:
             
             batch_items = data['items']
             self.logger.debug(f"Pagination page: offset={params.get('offset', 0)} limit={params.get('limit', 50)} page_size={len(batch_items)}")
-            items.extend(batch_items)
+            collected += len(batch_items)
+            if batch_items:
+                yield batch_items
             
-            if total is not None and len(items) >= total:
-                self.logger.debug(f"Pagination complete: collected {len(items)} of {total} items")
+            if total is not None and collected >= total:
+                self.logger.debug(f"Pagination complete: collected {collected} of {total} items")
                 break
 
             # Continue until an empty page is returned; some endpoints may return short pages even when more remain
@@ -367,8 +409,6 @@ class TidalClient:
 
             params['offset'] += len(batch_items)
             self.logger.debug(f"Pagination: next offset={params['offset']} (page_size={len(batch_items)}, total={total})")
-        
-        return items
     
     def _parse_model(self, data: Dict[str, Any], model_class: Type[T]) -> T:
         """
@@ -978,6 +1018,26 @@ class TidalClient:
         self.logger.info(f"Successfully processed {len(tracks)} favorite tracks")
         return tracks
     
+    async def iter_favorite_tracks(self) -> AsyncIterator[Track]:
+        """
+        Iterate over the user's favorite tracks page by page, without
+        materializing the whole list.
+        
+        Yields:
+            Track objects
+        """
+        self.logger.info(f"Streaming favorite tracks for user {self.login_key.userId}")
+        
+        async for page in self._iter_item_pages(f'users/{self.login_key.userId}/favorites/tracks'):
+            for item in page:
+                try:
+                    if isinstance(item, dict) and 'item' in item:
+                        yield self._parse_model(item['item'], Track)
+                    else:
+                        self.logger.warning(f"Favorite track item has unexpected format: {item}")
+                except Exception as e:
+                    self.logger.error(f"Error processing favorite track: {str(e)}")
+    
     async def get_favorite_albums(self) -> List[Album]:
         """
         Get the user's favorite albums.
@@ -1373,7 +1433,8 @@ class TidalClient:
         query: str,
         types: Optional[List[str]] = None,
         limit: int = 20,
-        offset: int = 0
+        offset: int = 0,
+        use_cache: bool = True
     ) -> Optional[SearchResult]:
         """
         Search for content on Tidal.
@@ -1383,6 +1444,7 @@ class TidalClient:
             types: List of types to search for (artist, album, track, video, playlist)
             limit: Maximum number of results per type
             offset: Offset for pagination
+            use_cache: Whether to reuse a cached response (False forces a fresh search)
             
         Returns:
             SearchResult object or None
@@ -1432,7 +1494,20 @@ class TidalClient:
             endpoint = f'search/{endpoint_type}'
             params['query'] = query  # Add query as a parameter instead of in the URL
             
-            data = await self._get(endpoint, params)
+            data = None
+            cache_key = ResponseCache.make_key(endpoint, params)
+            if self.search_cache:
+                if use_cache:
+                    data = await self.search_cache.get(cache_key)
+                    if data is not None:
+                        self.logger.debug(f"Using cached search response for: {query}")
+                else:
+                    await self.search_cache.delete(cache_key)
+            
+            if data is None:
+                data = await self._get(endpoint, params)
+                if self.search_cache and 'items' in data:
+                    await self.search_cache.set(cache_key, data)
             
             # Create a SearchResult-compatible structure
             search_result = {
@@ -1456,6 +1531,47 @@ class TidalClient:
             self.logger.error(f"Search error: {str(e)}")
             return None
     
+    ISRC_BATCH_SIZE = 20
+    
+    async def search_tracks_by_isrcs(self, isrcs: List[str]) -> Dict[str, Track]:
+        """
+        Look up tracks for many ISRCs using batched requests.
+        
+        ISRCs are sent in groups of ``ISRC_BATCH_SIZE`` per request. ISRCs that
+        are not found (or whose batch fails) are simply missing from the result,
+        so callers can fall back to per-track searches.
+        
+        Args:
+            isrcs: ISRC codes to look up
+            
+        Returns:
+            Dictionary mapping ISRC to the first matching track
+        """
+        wanted = list(dict.fromkeys(isrc.upper() for isrc in isrcs if isrc))
+        results: Dict[str, Track] = {}
+        
+        async def fetch_batch(batch: List[str]) -> None:
+            try:
+                data = await self._get('tracks', {'isrc': ','.join(batch), 'limit': len(batch) * 5})
+            except APIError as e:
+                self.logger.warning(f"Batched ISRC lookup failed for {len(batch)} ISRCs: {str(e)}")
+                return
+            
+            batch_set = set(batch)
+            for item in data.get('items', []):
+                isrc = (item.get('isrc') or '').upper()
+                if isrc in batch_set and isrc not in results:
+                    results[isrc] = self._parse_model(item, Track)
+        
+        batches = [
+            wanted[i:i + self.ISRC_BATCH_SIZE]
+            for i in range(0, len(wanted), self.ISRC_BATCH_SIZE)
+        ]
+        await asyncio.gather(*(fetch_batch(batch) for batch in batches))
+        
+        self.logger.info(f"Resolved {len(results)}/{len(wanted)} ISRCs in {len(batches)} requests")
+        return results
+    
     async def get_video_stream_url(self, video_id: str, quality: VideoQuality) -> VideoStreamUrl:
         """
         Get the stream URL for a video.
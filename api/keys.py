@@ -61,7 +61,28 @@ __KEYS_JSON__ = '''
 }
 '''
 
-__API_KEYS__ = json.loads(__KEYS_JSON__)
+
+
+def _parse_keys(content: str) -> Dict[str, Any]:
+    """
+    Parse an API keys JSON document.
+    
+    The string 'valid' flag of each key is also parsed once into a
+    'valid_bool' entry.
+    
+    Args:
+        content: JSON document with a 'keys' list
+        
+    Returns:
+        Parsed API keys document
+    """
+    data = json.loads(content)
+    for key in data['keys']:
+        key['valid_bool'] = key.get('valid') == 'True'
+    return data
+
+
+__API_KEYS__ = _parse_keys(__KEYS_JSON__)
 
 # Error key to return when an invalid index is requested
 __ERROR_KEY__ = {
@@ -70,6 +91,7 @@ __ERROR_KEY__ = {
     'clientId': '',
     'clientSecret': '',
     'valid': 'False',
+    'valid_bool': False,
 }
 
 
@@ -78,7 +100,7 @@ def get_num_keys() -> int:
     return len(__API_KEYS__['keys'])
 
 
-def get_key(index: int) -> Dict[str, str]:
+def get_key(index: int) -> Dict[str, Any]:
     """
     Get an API key by index.
     
@@ -104,10 +126,10 @@ def is_key_valid(index: int) -> bool:
         True if the key is valid, False otherwise
     """
     key = get_key(index)
-    return key['valid'] == 'True'
+    return key['valid_bool']
 
 
-def get_all_keys() -> List[Dict[str, str]]:
+def get_all_keys() -> List[Dict[str, Any]]:
     """
     Get all available API keys.
     
@@ -151,7 +173,7 @@ def update_keys_from_gist() -> bool:
         if response.status_code == 200:
             content = response.json()['files']['tidal-api-key.json']['content']
             global __API_KEYS__
-            __API_KEYS__ = json.loads(content)
+            __API_KEYS__ = _parse_keys(content)
             logger.info(f"API keys updated to version {get_version()}")
             return True
         else:
@@ -13,6 +13,9 @@ from urllib.parse import quote
 import aiohttp
 from pydantic import BaseModel, Field
 
+from riptidal import __version__
+from riptidal.api.response_cache import ResponseCache
+from riptidal.api.session import create_session
 from riptidal.utils.logger import get_logger
 
 
@@ -68,53 +71,74 @@ class MusicBrainzClient:
     using the MusicBrainz database.
     """
     
-    def __init__(self, user_agent: str = "RIPTIDAL/0.1.99 (https://github.com/riptidal)"):
+    def __init__(
+        self,
+        user_agent: str = f"RIPTIDAL/{__version__} (https://github.com/ishumilin/riptidal)",
+        cache: Optional[ResponseCache] = None
+    ):
         """
         Initialize the MusicBrainz client.
         
         Args:
             user_agent: User agent string for API requests
+            cache: Optional disk cache for API responses
         """
+        self.cache = cache
         self.base_url = "https://musicbrainz.org/ws/2"
         self.user_agent = user_agent
         self.logger = get_logger(__name__)
         self.session: Optional[aiohttp.ClientSession] = None
         self._last_request_time = 0
-        self._rate_limit_delay = 1.0  # 1 second between requests
+        # MusicBrainz allows 1 request/second per IP; keep a small safety margin
+        self._rate_limit_delay = 1.05
+        self._rate_limit_lock = asyncio.Lock()
     
     async def __aenter__(self):
         """Context manager entry."""
         if self.session is None:
-            self.session = aiohttp.ClientSession(
+            self.session = create_session(
                 headers={"User-Agent": self.user_agent}
             )
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
+        await self.close()
+    
+    async def close(self):
+        """Close the client session and response cache."""
         if self.session:
+            self.logger.debug("Closing MusicBrainz client session")
             await self.session.close()
             self.session = None
+        if self.cache:
+            self.cache.close()
     
     def _get_session(self) -> aiohttp.ClientSession:
         """Get the current session or create a new one."""
         if self.session is None:
-            self.session = aiohttp.ClientSession(
+            self.session = create_session(
                 headers={"User-Agent": self.user_agent}
             )
         return self.session
     
     async def _ensure_rate_limit(self):
-        """Ensure we don't exceed the rate limit."""
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-        
-        if time_since_last < self._rate_limit_delay:
-            wait_time = self._rate_limit_delay - time_since_last
-            self.logger.debug(f"Rate limiting: waiting {wait_time:.2f} seconds")
-            await asyncio.sleep(wait_time)
+        """
+        Ensure we don't exceed the rate limit.
         
-        self._last_request_time = time.time()
+        Concurrent callers are serialized so requests stay spaced out
+        regardless of how many matches run in parallel.
+        """
+        async with self._rate_limit_lock:
+            current_time = time.monotonic()
+            time_since_last = current_time - self._last_request_time
+            
+            if time_since_last < self._rate_limit_delay:
+                wait_time = self._rate_limit_delay - time_since_last
+                self.logger.debug(f"Rate limiting: waiting {wait_time:.2f} seconds")
+                await asyncio.sleep(wait_time)
+            
+            self._last_request_time = time.monotonic()
     
     async def _request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -127,8 +151,6 @@ class MusicBrainzClient:
         Returns:
             Response data as a dictionary
         """
-        await self._ensure_rate_limit()
-        
         url = f"{self.base_url}/{endpoint}"
         
         if params is None:
@@ -137,6 +159,16 @@ class MusicBrainzClient:
         # Always request JSON format
         params['fmt'] = 'json'
         
+        # Cached responses don't count against the rate limit
+        cache_key = ResponseCache.make_key(url, params)
+        if self.cache:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                self.logger.debug(f"Using cached MusicBrainz response for {url}")
+                return cached
+        
+        await self._ensure_rate_limit()
+        
         self.logger.debug(f"MusicBrainz API request: GET {url} with params: {params}")
         
         try:
@@ -153,6 +185,8 @@ class MusicBrainzClient:
                 response.raise_for_status()
                 data = await response.json()
                 self.logger.debug(f"MusicBrainz API response: {response.status}")
+                if self.cache:
+                    await self.cache.set(cache_key, data)
                 return data
                 
         except aiohttp.ClientError as e:
@@ -0,0 +1,73 @@
+"""
+Rate limiting utilities for RIPTIDAL.
+
+This module provides an adaptive request rate gate used to keep
+API request bursts below the server's rate limits.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+from riptidal.utils.logger import get_logger
+
+
+class AdaptiveRateGate:
+    """
+    Spaces out requests to at most ``rate`` per second.
+
+    The rate is halved whenever the server signals throttling (429/503) and
+    slowly recovers towards ``max_rate`` on successful responses. A server
+    supplied Retry-After pauses all callers until it has elapsed.
+    """
+
+    def __init__(self, max_rate: float = 8.0, min_rate: float = 1.0, recovery_step: float = 0.25):
+        """
+        Initialize the rate gate.
+
+        Args:
+            max_rate: Maximum requests per second
+            min_rate: Lower bound the rate can shrink to
+            recovery_step: Rate increase per successful response
+        """
+        self.max_rate = max_rate
+        self.min_rate = min(min_rate, max_rate)
+        self.recovery_step = recovery_step
+        self.rate = max_rate
+        self.logger = get_logger(__name__)
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    async def acquire(self) -> None:
+        """Wait until the next request slot is available."""
+        async with self._lock:
+            now = time.monotonic()
+            wait_time = self._next_slot - now
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+                now = time.monotonic()
+            self._next_slot = max(now, self._next_slot) + 1.0 / self.rate
+
+    def penalize(self, retry_after: Optional[float] = None) -> None:
+        """
+        Shrink the rate after a throttled response.
+
+        Args:
+            retry_after: Seconds the server asked us to wait, if any
+        """
+        self.rate = max(self.min_rate, self.rate / 2)
+        if retry_after:
+            self._next_slot = max(self._next_slot, time.monotonic() + retry_after)
+        self.logger.debug(f"Rate gate penalized: {self.rate:.2f} req/s")
+
+    def reward(self) -> None:
+        """Grow the rate back towards the maximum after a successful response."""
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.recovery_step)
@@ -0,0 +1,146 @@
+"""
+Response caching for RIPTIDAL.
+
+This module provides a small SQLite-backed cache for API responses so
+repeated library upgrade runs can reuse earlier search results instead of
+re-issuing identical requests.
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+from riptidal.utils.logger import get_logger
+
+
+class ResponseCache:
+    """
+    Disk cache for JSON API responses with a fixed time-to-live.
+
+    Entries are keyed by URL and query parameters. SQLite access runs in a
+    worker thread so cache lookups don't block the event loop.
+    """
+
+    def __init__(self, path: Path, expire_after: float):
+        """
+        Initialize the response cache.
+
+        Args:
+            path: Path to the SQLite database file
+            expire_after: Time-to-live for cached entries, in seconds
+        """
+        self.path = path
+        self.expire_after = expire_after
+        self.logger = get_logger(__name__)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build a cache key from a URL and its query parameters.
+
+        Args:
+            url: Request URL or endpoint
+            params: Query parameters
+
+        Returns:
+            Cache key string
+        """
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted((k, str(v)) for k, v in params.items()))}"
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, created REAL NOT NULL, body TEXT NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def _get_sync(self, key: str) -> Optional[Any]:
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT created, body FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            created, body = row
+            if time.time() - created > self.expire_after:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                conn.commit()
+                return None
+        return json.loads(body)
+
+    def _set_sync(self, key: str, value: Any) -> None:
+        body = json.dumps(value)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, created, body) VALUES (?, ?, ?)",
+                (key, time.time(), body)
+            )
+            conn.commit()
+
+    def _delete_sync(self, key: str) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            conn.commit()
+
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached response.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached response data, or None if missing or expired
+        """
+        try:
+            return await asyncio.to_thread(self._get_sync, key)
+        except (sqlite3.Error, ValueError) as e:
+            self.logger.warning(f"Response cache read failed: {str(e)}")
+            return None
+
+    async def set(self, key: str, value: Any) -> None:
+        """
+        Store a response in the cache.
+
+        Args:
+            key: Cache key from make_key
+            value: JSON-serializable response data
+        """
+        try:
+            await asyncio.to_thread(self._set_sync, key, value)
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self.logger.warning(f"Response cache write failed: {str(e)}")
+
+    async def delete(self, key: str) -> None:
+        """
+        Remove a response from the cache, e.g. to force a fresh search.
+
+        Args:
+            key: Cache key from make_key
+        """
+        try:
+            await asyncio.to_thread(self._delete_sync, key)
+        except sqlite3.Error as e:
+            self.logger.warning(f"Response cache delete failed: {str(e)}")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
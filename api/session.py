@@ -0,0 +1,30 @@
+"""
+HTTP session helpers for RIPTIDAL.
+
+This module provides a factory for aiohttp sessions with a connection pool
+tuned for many concurrent requests to a small number of API hosts.
+"""
+
+import aiohttp
+
+
+def create_session(**kwargs) -> aiohttp.ClientSession:
+    """
+    Create an aiohttp session with a tuned connection pool.
+    
+    Connections are kept alive and DNS lookups are cached so that
+    concurrent API requests reuse existing TLS connections.
+    
+    Args:
+        **kwargs: Additional arguments for aiohttp.ClientSession
+        
+    Returns:
+        New ClientSession instance
+    """
+    connector = aiohttp.TCPConnector(
+        limit=64,
+        limit_per_host=8,
+        ttl_dns_cache=300,
+        keepalive_timeout=60
+    )
+    return aiohttp.ClientSession(connector=connector, trust_env=True, **kwargs)
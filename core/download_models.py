@@ -35,6 +35,7 @@ class DownloadProgress(BaseModel):
     is_original: bool = False  # Whether this track/video is from the original favorites/playlist
     is_video: bool = False  # Whether this is a video download
     album_initial_completed: Optional[int] = None  # Initial completed tracks when starting album download
+    _counted_for_progress: bool = False  # Set once the progress display has counted this item
 
     @property
     def progress_percentage(self) -> float:
@@ -5,10 +5,14 @@ This module provides functionality to scan a music library folder,
 extract metadata from audio files, and prepare them for upgrade.
 """
 
+import asyncio
 import os
+import sqlite3
+from collections import Counter
+from contextlib import closing
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple, Any
+from dataclasses import astuple, dataclass, field, fields
 
 try:
     from mutagen import File as MutagenFile
@@ -60,6 +64,46 @@ class LibraryTrack:
             return self.file_path.name
 
 
+def _album_key(track: LibraryTrack) -> str:
+    """Get the key used to group a track into an album."""
+    album_artist = track.album_artist or track.artist or "Unknown Artist"
+    album_name = track.album or "Unknown Album"
+    return f"{album_artist} - {album_name}"
+
+
+@dataclass
+class LibraryStatistics:
+    """Running statistics over scanned library tracks."""
+    total_tracks: int = 0
+    total_size: int = 0
+    formats: Counter = field(default_factory=Counter)
+    tracks_with_isrc: int = 0
+    tracks_with_musicbrainz: int = 0
+    album_keys: Set[str] = field(default_factory=set)
+    
+    def add(self, track: LibraryTrack) -> None:
+        """Account for a newly scanned track."""
+        self.total_tracks += 1
+        self.total_size += track.file_size
+        self.formats[track.format or 'unknown'] += 1
+        if track.isrc:
+            self.tracks_with_isrc += 1
+        if track.musicbrainz_id:
+            self.tracks_with_musicbrainz += 1
+        self.album_keys.add(_album_key(track))
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the statistics in the format returned by LibraryScanner.get_statistics."""
+        return {
+            'total_tracks': self.total_tracks,
+            'total_albums': len(self.album_keys),
+            'total_size_mb': self.total_size / (1024 * 1024),
+            'formats': self.formats,
+            'tracks_with_isrc': self.tracks_with_isrc,
+            'tracks_with_musicbrainz': self.tracks_with_musicbrainz
+        }
+
+
 class LibraryScanner:
     """
     Scanner for music library folders.
@@ -71,35 +115,51 @@ class LibraryScanner:
     # Supported audio file extensions
     SUPPORTED_EXTENSIONS = {'.mp3', '.flac', '.m4a', '.mp4', '.ogg', '.opus', '.wma'}
     
-    def __init__(self):
-        """Initialize the library scanner."""
+    # Columns of the scan cache, after path and mtime
+    _CACHE_COLUMNS = [f.name for f in fields(LibraryTrack) if f.name != 'file_path']
+    
+    def __init__(self, cache_path: Optional[Path] = None):
+        """
+        Initialize the library scanner.
+        
+        Args:
+            cache_path: Optional SQLite file used to cache extracted metadata between scans
+        """
         self.logger = get_logger(__name__)
+        self.cache_path = cache_path
+        # Statistics for the most recent scan, updated as tracks are found
+        self.stats = LibraryStatistics()
         
         if not MUTAGEN_AVAILABLE:
             self.logger.warning("Mutagen library not available. Install with: pip install mutagen")
     
-    async def scan_directory(self, directory: Path, recursive: bool = True) -> List[LibraryTrack]:
+    async def scan_directory(self, directory: Path, recursive: bool = True) -> AsyncIterator[LibraryTrack]:
         """
-        Scan a directory for audio files.
+        Scan a directory for audio files, yielding tracks as they are found.
         
         Args:
             directory: Directory to scan
             recursive: Whether to scan subdirectories
             
-        Returns:
-            List of LibraryTrack objects
+        Yields:
+            LibraryTrack objects
         """
         if not directory.exists():
             self.logger.error(f"Directory does not exist: {directory}")
-            return []
+            return
         
         if not directory.is_dir():
             self.logger.error(f"Path is not a directory: {directory}")
-            return []
+            return
         
         self.logger.info(f"Scanning directory: {directory}")
         
-        tracks = []
+        cached: Dict[Path, Tuple[float, LibraryTrack]] = {}
+        if self.cache_path:
+            cached = await asyncio.to_thread(self.load_cached, self.cache_path)
+        new_rows: List[Tuple[float, LibraryTrack]] = []
+        self.stats = LibraryStatistics()
+        
         
         if recursive:
             # Walk through all subdirectories
@@ -114,20 +174,106 @@ class LibraryScanner:
                     
                     file_path = root_path / file
                     if file_path.suffix.lower() in self.SUPPORTED_EXTENSIONS:
-                        track = await self._extract_metadata(file_path)
+                        track = await self._scan_file(file_path, cached, new_rows)
                         if track:
-                            tracks.append(track)
+                            self.stats.add(track)
+                            yield track
         else:
             # Only scan the top-level directory
             for file_path in directory.iterdir():
                 if file_path.is_file() and not file_path.name.startswith('.'):
                     if file_path.suffix.lower() in self.SUPPORTED_EXTENSIONS:
-                        track = await self._extract_metadata(file_path)
+                        track = await self._scan_file(file_path, cached, new_rows)
                         if track:
-                            tracks.append(track)
+                            self.stats.add(track)
+                            yield track
+        
+        if self.cache_path and new_rows:
+            await asyncio.to_thread(self._save_cached, self.cache_path, new_rows)
+        
+        found = self.stats.total_tracks
+        self.logger.info(f"Found {found} audio files in {directory} ({found - len(new_rows)} from cache)")
+    
+    async def _scan_file(
+        self,
+        file_path: Path,
+        cached: Dict[Path, Tuple[float, LibraryTrack]],
+        new_rows: List[Tuple[float, LibraryTrack]]
+    ) -> Optional[LibraryTrack]:
+        """
+        Get a track for a file, reusing cached metadata if the file is unchanged.
+        
+        Args:
+            file_path: Path to the audio file
+            cached: Cached (mtime, track) entries by path
+            new_rows: Collects freshly extracted (mtime, track) entries for the cache
+            
+        Returns:
+            LibraryTrack object or None if the file could not be read
+        """
+        try:
+            stat = file_path.stat()
+        except OSError as e:
+            self.logger.error(f"Cannot stat {file_path}: {str(e)}")
+            return None
+        
+        entry = cached.get(file_path)
+        if entry and entry[0] == stat.st_mtime and entry[1].file_size == stat.st_size:
+            return entry[1]
+        
+        track = await self._extract_metadata(file_path)
+        if track and self.cache_path:
+            new_rows.append((stat.st_mtime, track))
+        return track
+    
+    def load_cached(self, db_path: Path) -> Dict[Path, Tuple[float, LibraryTrack]]:
+        """
+        Load cached scan results.
+        
+        Args:
+            db_path: Path to the SQLite scan cache
+            
+        Returns:
+            Dictionary mapping file path to (mtime, LibraryTrack)
+        """
+        if not db_path.exists():
+            return {}
         
-        self.logger.info(f"Found {len(tracks)} audio files in {directory}")
-        return tracks
+        columns = ", ".join(self._CACHE_COLUMNS)
+        try:
+            with closing(sqlite3.connect(str(db_path))) as conn, conn:
+                rows = conn.execute(f"SELECT path, mtime, {columns} FROM tracks").fetchall()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Could not read library scan cache {db_path}: {str(e)}")
+            return {}
+        
+        cached = {}
+        for path, mtime, *values in rows:
+            file_path = Path(path)
+            cached[file_path] = (mtime, LibraryTrack(file_path, *values))
+        self.logger.debug(f"Loaded {len(cached)} cached library tracks")
+        return cached
+    
+    def _save_cached(self, db_path: Path, rows: List[Tuple[float, LibraryTrack]]) -> None:
+        """
+        Write scan results to the cache in a single transaction.
+        
+        Args:
+            db_path: Path to the SQLite scan cache
+            rows: (mtime, LibraryTrack) entries to store
+        """
+        columns = ", ".join(self._CACHE_COLUMNS)
+        placeholders = ", ".join("?" for _ in range(len(self._CACHE_COLUMNS) + 2))
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            with closing(sqlite3.connect(str(db_path))) as conn, conn:
+                conn.execute(f"CREATE TABLE IF NOT EXISTS tracks (path TEXT PRIMARY KEY, mtime REAL, {columns})")
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO tracks (path, mtime, {columns}) VALUES ({placeholders})",
+                    [(str(track.file_path), mtime, *astuple(track)[1:]) for mtime, track in rows]
+                )
+        except sqlite3.Error as e:
+            self.logger.warning(f"Could not update library scan cache {db_path}: {str(e)}")
     
     async def _extract_metadata(self, file_path: Path) -> Optional[LibraryTrack]:
         """
@@ -259,10 +405,7 @@ class LibraryScanner:
         albums = {}
         
         for track in tracks:
-            # Create album key
-            album_artist = track.album_artist or track.artist or "Unknown Artist"
-            album_name = track.album or "Unknown Album"
-            album_key = f"{album_artist} - {album_name}"
+            album_key = _album_key(track)
             
             if album_key not in albums:
                 albums[album_key] = []
@@ -275,30 +418,21 @@ class LibraryScanner:
         
         return albums
     
-    def get_statistics(self, tracks: List[LibraryTrack]) -> Dict[str, Any]:
+    def get_statistics(self, tracks: Optional[List[LibraryTrack]] = None) -> Dict[str, Any]:
         """
         Get statistics about the scanned tracks.
         
         Args:
-            tracks: List of tracks
+            tracks: List of tracks to summarize; defaults to the tracks found
+                by the most recent scan_directory call
             
         Returns:
             Dictionary with statistics
         """
-        total_size = sum(t.file_size for t in tracks)
-        formats = {}
+        if tracks is None:
+            return self.stats.as_dict()
         
+        stats = LibraryStatistics()
         for track in tracks:
-            fmt = track.format or 'unknown'
-            formats[fmt] = formats.get(fmt, 0) + 1
-        
-        albums = self.group_by_album(tracks)
-        
-        return {
-            'total_tracks': len(tracks),
-            'total_albums': len(albums),
-            'total_size_mb': total_size / (1024 * 1024),
-            'formats': formats,
-            'tracks_with_isrc': sum(1 for t in tracks if t.isrc),
-            'tracks_with_musicbrainz': sum(1 for t in tracks if t.musicbrainz_id)
-        }
+            stats.add(track)
+        return stats.as_dict()
@@ -5,7 +5,10 @@ This module provides classes and functions for managing application settings
 using Pydantic for validation and type checking.
 """
 
+import atexit
 import json
+import os
+import time
 from enum import Enum, auto
 from pathlib import Path
 from typing import Optional, Union, List, Dict, Any
@@ -33,6 +36,20 @@ class VideoQuality(str, Enum):
     MAX = "MAX"  # Will try to get the highest available quality
 
 
+class SyncPolicy(str, Enum):
+    """When settings writes are flushed to disk with fsync."""
+    ALWAYS = "ALWAYS"  # fsync on every save
+    INTERVAL = "INTERVAL"  # fsync at most once per SETTINGS_FSYNC_INTERVAL seconds, and at exit
+    NEVER = "NEVER"  # Leave flushing to the operating system
+
+
+# Minimum seconds between fsyncs with SyncPolicy.INTERVAL
+SETTINGS_FSYNC_INTERVAL = 30.0
+_last_fsync = 0.0
+# Settings file written under SyncPolicy.INTERVAL without an fsync yet
+_pending_fsync: Optional[Path] = None
+
+
 class Settings(BaseModel):
     """
     Application settings model.
@@ -51,6 +68,8 @@ class Settings(BaseModel):
     playlist_path_format: str = "Playlists/{playlist_name}"
     download_full_albums: bool = False
     create_m3u_playlists: bool = True
+    m3u_prewrite_threshold: int = 10  # Write playlist M3U before downloading only for at least this many new tracks
+    playlist_checkpoint_interval: int = 0  # Save library every N playlists (0 = only at the end)
     
     # Track settings
     track_path_format: str = "{artist_name}/{album_name}/{track_number} - {track_title}"
@@ -59,6 +78,11 @@ class Settings(BaseModel):
     connection_timeout: int = 30
     retry_attempts: int = 3
     retry_delay: int = 5
+    api_rate_limit: float = 8.0  # Max Tidal API requests per second (reduced automatically on 429/503)
+    max_concurrent_metadata: int = 8  # Concurrent album/metadata API requests
+    match_concurrency: int = 8  # Concurrent track matches during library upgrade
+    response_cache_enabled: bool = True  # Cache search responses on disk between runs
+    search_cache_days: int = 7  # How long cached Tidal search responses stay valid
     
     # Authentication settings
     auth_token: Optional[str] = None
@@ -69,6 +93,9 @@ class Settings(BaseModel):
     
     # API settings
     api_key_index: int = 4
+    
+    # Storage settings
+    sync_policy: SyncPolicy = SyncPolicy.NEVER  # Whether settings saves are fsynced
 
     # Matching behavior for library existence checks: "id" or "id_or_metadata"
     match_mode: str = "id_or_metadata"
@@ -155,6 +182,80 @@ def save_settings(settings: Settings, config_path: Optional[Union[str, Path]] =
     # Ensure the directory exists
     config_file.parent.mkdir(parents=True, exist_ok=True)
     
-    # Save settings to file
-    with open(config_file, "w", encoding="utf-8") as f:
-        json.dump(settings.model_dump(mode='json'), f, indent=2)
+    # Write to a temporary file and rename it over the original, so a crash
+    # mid-write never leaves a truncated settings file behind
+    data = memoryview(json.dumps(settings.model_dump(mode='json'), indent=2).encode("utf-8"))
+    tmp_file = config_file.with_name(config_file.name + ".tmp")
+    fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+            synced = _should_fsync(settings.sync_policy)
+            if synced:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_file, config_file)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+        raise
+    
+    _track_pending_fsync(config_file, settings.sync_policy, synced)
+
+
+def _should_fsync(policy: SyncPolicy) -> bool:
+    """
+    Decide whether a settings write should be fsynced.
+    
+    Args:
+        policy: Configured sync policy
+        
+    Returns:
+        True if the write should be flushed to disk
+    """
+    global _last_fsync
+    if policy == SyncPolicy.ALWAYS:
+        return True
+    if policy == SyncPolicy.INTERVAL:
+        now = time.monotonic()
+        if now - _last_fsync >= SETTINGS_FSYNC_INTERVAL:
+            _last_fsync = now
+            return True
+    return False
+
+
+def _track_pending_fsync(config_file: Path, policy: SyncPolicy, synced: bool) -> None:
+    """
+    Remember an INTERVAL-mode write that was not fsynced so it is flushed at exit.
+    
+    Args:
+        config_file: Settings file that was just written
+        policy: Configured sync policy
+        synced: Whether the write was already fsynced
+    """
+    global _pending_fsync
+    if policy == SyncPolicy.INTERVAL and not synced:
+        _pending_fsync = config_file
+    else:
+        _pending_fsync = None
+
+
+def _flush_pending_fsync() -> None:
+    """Fsync the last settings file written under SyncPolicy.INTERVAL, if any."""
+    global _pending_fsync, _last_fsync
+    config_file, _pending_fsync = _pending_fsync, None
+    if config_file is None:
+        return
+    try:
+        fd = os.open(config_file, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+        _last_fsync = time.monotonic()
+    finally:
+        os.close(fd)
+
+
+atexit.register(_flush_pending_fsync)
@@ -19,6 +19,13 @@ from typing import Dict, Iterable, List, Optional, Set, Tuple, Any
 import aiofiles
 from pydantic import BaseModel
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
 from riptidal.api.models import Track, Album
 from riptidal.core.settings import Settings
 from riptidal.core.download_models import AlbumDownloadStatus
@@ -207,12 +214,22 @@ class TrackManager:
             self._state["generated_at"] = _now_iso()
 
             tmp_path = self.state_path.with_suffix(".json.tmp")
-            data_str = json.dumps(self._state, indent=2)
+            data = None
+            if ORJSON_AVAILABLE:
+                try:
+                    data = orjson.dumps(
+                        self._state, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+                    )
+                except TypeError as e:
+                    # e.g. non-str dict keys, which the stdlib encoder coerces
+                    self.logger.debug(f"orjson could not encode state, falling back to json: {e}")
+            if data is None:
+                data = json.dumps(self._state, indent=2).encode("utf-8")
 
             # Use synchronous write for atomic replace; aiofiles doesn't provide atomic renaming
             self.state_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(tmp_path, "w", encoding="utf-8") as f:
-                f.write(data_str)
+            with open(tmp_path, "wb") as f:
+                f.write(data)
             os.replace(tmp_path, self.state_path)
             self.logger.info(
                 f"Unified library state saved: tracks={len(self._state.get('tracks', {}))}, "
@@ -419,48 +436,15 @@ class TrackManager:
             track_id: Track ID
             path: Path to the track file
         """
-        self.logger.debug(f"Attempting to add track {track_id} with path {path} to index.")
-
-        abs_path = path.absolute()
-        self.logger.debug(f"Using absolute path: {abs_path}")
+        self.logger.debug("Attempting to add track %s with path %s to index.", track_id, path)
 
         try:
-            if not abs_path.exists():
-                if not allow_missing_file:
-                    self.logger.warning(f"Track file does not exist at path for add_track: {abs_path}")
-                    return
-                # Virtual entry: no file on disk, index-only
-                file_size = 0
-                file_mtime = time.time()
-                file_hash = f"virtual_{track_id}"
-            else:
-                stats = abs_path.stat()
-                file_size = stats.st_size
-                file_mtime = stats.st_mtime
-
-                if file_size == 0:
-                    self.logger.warning(f"Track file has zero size: {abs_path}")
-                    return
-
-                hash_md5 = hashlib.md5()
-                try:
-                    async with aiofiles.open(abs_path, "rb") as f:
-                        chunk_size = 4096
-                        while chunk := await f.read(chunk_size):
-                            hash_md5.update(chunk)
-                    file_hash = hash_md5.hexdigest()
-                except Exception as hash_e:
-                    self.logger.warning(f"Error calculating hash, using simplified method: {str(hash_e)}")
-                    file_hash = f"{file_size}_{file_mtime}"
+            local_track = await self._build_local_track(track_id, path, allow_missing_file)
+            if local_track is None:
+                return
 
             # Update legacy in-memory
-            self.local_tracks[track_id] = LocalTrack(
-                id=track_id,
-                path=abs_path,
-                hash=file_hash,
-                size=file_size,
-                last_modified=file_mtime,
-            )
+            self.local_tracks[track_id] = local_track
 
             # Persist legacy & unified
             max_retries = 3
@@ -472,50 +456,20 @@ class TrackManager:
                     # Enrich unified state with provided metadata (without overwriting existing values)
                     try:
                         await self._load_state()
-                        t = self._state.setdefault("tracks", {}).setdefault(str(track_id), {})
-                        # Core path-related fields already set by _sync_unified_tracks_from_local
-                        # Set timestamps and existence for successful download
-                        if not t.get("downloaded_at"):
-                            t["downloaded_at"] = _now_iso()
-                        t["exists_on_disk"] = True
-                        t["last_verified"] = _now_iso()
-
-                        # Artist/Album enrichment
-                        if artist_names and not t.get("artist_names"):
-                            t["artist_names"] = artist_names
-                        if album_id and not t.get("album_id"):
-                            t["album_id"] = album_id
-                        if album_title and not t.get("album_title"):
-                            t["album_title"] = album_title
-
-                        # Title enrichment
-                        if track_title and not t.get("title"):
-                            t["title"] = track_title
-
-                        # ISRC enrichment
-                        if isrc and not t.get("isrc"):
-                            t["isrc"] = isrc
-
-                        # Quality enrichment
-                        q = t.setdefault("quality", {"requested": "", "actual": None, "codec": None})
-                        if quality_requested and not q.get("requested"):
-                            q["requested"] = quality_requested
-                        if quality_actual and not q.get("actual"):
-                            q["actual"] = quality_actual
-                        if codec and not q.get("codec"):
-                            q["codec"] = codec
-
-                        # Sources enrichment
-                        s = t.setdefault("sources", {"favorites": False, "playlists": [], "artists": []})
-                        if source_favorites is True:
-                            s["favorites"] = True
-                        if source_playlist:
-                            if source_playlist not in s["playlists"]:
-                                s["playlists"].append(source_playlist)
-                        if source_artist:
-                            if source_artist not in s["artists"]:
-                                s["artists"].append(source_artist)
-
+                        self._enrich_track_state(
+                            track_id,
+                            album_id=album_id,
+                            album_title=album_title,
+                            artist_names=artist_names,
+                            quality_requested=quality_requested,
+                            quality_actual=quality_actual,
+                            codec=codec,
+                            track_title=track_title,
+                            isrc=isrc,
+                            source_favorites=source_favorites,
+                            source_playlist=source_playlist,
+                            source_artist=source_artist,
+                        )
                         await self._save_state_atomic()
                     except Exception as enrich_e:
                         self.logger.warning(f"Failed to enrich unified state for track {track_id}: {enrich_e}")
@@ -533,6 +487,180 @@ class TrackManager:
             self.logger.error(f"Error adding track {track_id} to index: {str(e)}", exc_info=True)
             self.logger.info(f"Track {track_id} is in memory but may not be saved to disk")
 
+    BULK_CHUNK_SIZE = 500
+
+    async def add_tracks_bulk(self, entries: List[Dict[str, Any]]) -> int:
+        """
+        Add many tracks to the index with a single save.
+
+        Each entry is a dict with "track_id" and "path" plus any of the keyword
+        arguments accepted by add_track.
+
+        Args:
+            entries: Track entries to add
+
+        Returns:
+            Number of tracks added
+        """
+        if not entries:
+            return 0
+
+        await self._load_state()
+
+        async def build(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            meta = dict(entry)
+            track_id = str(meta.pop("track_id"))
+            path = Path(meta.pop("path"))
+            allow_missing_file = meta.pop("allow_missing_file", False)
+            try:
+                local_track = await self._build_local_track(track_id, path, allow_missing_file)
+            except Exception as e:
+                self.logger.error(f"Error adding track {track_id} to index: {str(e)}", exc_info=True)
+                return None
+            if local_track is None:
+                return None
+            self.local_tracks[track_id] = local_track
+            meta["track_id"] = track_id
+            return meta
+
+        # Stat/hash files concurrently, a bounded chunk at a time
+        added: List[Dict[str, Any]] = []
+        chunk_size = self.BULK_CHUNK_SIZE
+        for start in range(0, len(entries), chunk_size):
+            chunk = entries[start:start + chunk_size]
+            built = await asyncio.gather(*(build(entry) for entry in chunk))
+            added.extend(meta for meta in built if meta is not None)
+
+        if not added:
+            return 0
+
+        try:
+            # Sync and enrich in memory, then persist once
+            await self._sync_unified_tracks_from_local()
+            for meta in added:
+                self._enrich_track_state(meta.pop("track_id"), **meta)
+            await self._save_state_atomic()
+            self.logger.debug(f"Successfully saved index after adding {len(added)} tracks")
+        except Exception as e:
+            self.logger.error(f"Error saving index after bulk add of {len(added)} tracks: {str(e)}", exc_info=True)
+            self.logger.info(f"{len(added)} tracks are in memory but may not be saved to disk")
+
+        return len(added)
+
+    async def _build_local_track(
+        self, track_id: str, path: Path, allow_missing_file: bool = False
+    ) -> Optional[LocalTrack]:
+        """
+        Stat and hash a track file into a LocalTrack entry.
+
+        Args:
+            track_id: Track ID
+            path: Path to the track file
+            allow_missing_file: Create an index-only entry if the file is missing
+
+        Returns:
+            LocalTrack, or None if the file is missing or empty
+        """
+        abs_path = path.absolute()
+        self.logger.debug("Using absolute path: %s", abs_path)
+
+        if not abs_path.exists():
+            if not allow_missing_file:
+                self.logger.warning(f"Track file does not exist at path for add_track: {abs_path}")
+                return None
+            # Virtual entry: no file on disk, index-only
+            file_size = 0
+            file_mtime = time.time()
+            file_hash = f"virtual_{track_id}"
+        else:
+            stats = abs_path.stat()
+            file_size = stats.st_size
+            file_mtime = stats.st_mtime
+
+            if file_size == 0:
+                self.logger.warning(f"Track file has zero size: {abs_path}")
+                return None
+
+            hash_md5 = hashlib.md5()
+            try:
+                async with aiofiles.open(abs_path, "rb") as f:
+                    chunk_size = 4096
+                    while chunk := await f.read(chunk_size):
+                        hash_md5.update(chunk)
+                file_hash = hash_md5.hexdigest()
+            except Exception as hash_e:
+                self.logger.warning(f"Error calculating hash, using simplified method: {str(hash_e)}")
+                file_hash = f"{file_size}_{file_mtime}"
+
+        return LocalTrack(
+            id=track_id,
+            path=abs_path,
+            hash=file_hash,
+            size=file_size,
+            last_modified=file_mtime,
+        )
+
+    def _enrich_track_state(
+        self,
+        track_id: str,
+        *,
+        album_id: Optional[str] = None,
+        album_title: Optional[str] = None,
+        artist_names: Optional[str] = None,
+        quality_requested: Optional[str] = None,
+        quality_actual: Optional[str] = None,
+        codec: Optional[str] = None,
+        track_title: Optional[str] = None,
+        isrc: Optional[str] = None,
+        source_favorites: Optional[bool] = None,
+        source_playlist: Optional[str] = None,
+        source_artist: Optional[str] = None,
+    ) -> None:
+        """Enrich the unified state entry of a track in memory (without overwriting existing values)."""
+        t = self._state.setdefault("tracks", {}).setdefault(str(track_id), {})
+        # Core path-related fields already set by _sync_unified_tracks_from_local
+        # Set timestamps and existence for successful download
+        if not t.get("downloaded_at"):
+            t["downloaded_at"] = _now_iso()
+        t["exists_on_disk"] = True
+        t["last_verified"] = _now_iso()
+
+        # Artist/Album enrichment
+        if artist_names and not t.get("artist_names"):
+            t["artist_names"] = artist_names
+        if album_id and not t.get("album_id"):
+            t["album_id"] = album_id
+        if album_title and not t.get("album_title"):
+            t["album_title"] = album_title
+
+        # Title enrichment
+        if track_title and not t.get("title"):
+            t["title"] = track_title
+
+        # ISRC enrichment
+        if isrc and not t.get("isrc"):
+            t["isrc"] = isrc
+
+        # Quality enrichment
+        q = t.setdefault("quality", {"requested": "", "actual": None, "codec": None})
+        if quality_requested and not q.get("requested"):
+            q["requested"] = quality_requested
+        if quality_actual and not q.get("actual"):
+            q["actual"] = quality_actual
+        if codec and not q.get("codec"):
+            q["codec"] = codec
+
+        # Sources enrichment
+        s = t.setdefault("sources", {"favorites": False, "playlists": [], "artists": []})
+        if source_favorites is True:
+            s["favorites"] = True
+        if source_playlist:
+            if source_playlist not in s["playlists"]:
+                s["playlists"].append(source_playlist)
+        if source_artist:
+            if source_artist not in s["artists"]:
+                s["artists"].append(source_artist)
+
     async def remove_track(self, track_id: str) -> None:
         """
         Remove a track from the index (legacy) and update unified state.
@@ -567,6 +695,25 @@ class TrackManager:
 
         return False, None
 
+    async def check_tracks_exist(self, track_ids: List[str]) -> Dict[str, Tuple[bool, Optional[Path]]]:
+        """
+        Batch variant of check_track_exists: loads state once and resolves all IDs.
+
+        Args:
+            track_ids: Track IDs
+
+        Returns:
+            Dict mapping each track ID (as str) to (exists, path)
+        """
+        await self._load_state()
+
+        results: Dict[str, Tuple[bool, Optional[Path]]] = {}
+        for track_id in track_ids:
+            key = str(track_id)
+            local_track = self.local_tracks.get(key)
+            results[key] = (True, local_track.path) if local_track else (False, None)
+        return results
+
     async def scan_directory(self, directory: Path) -> None:
         """
         Scan a directory for tracks and update the index.
@@ -592,7 +739,7 @@ class TrackManager:
         # Simple heuristic: log unindexed files (no automatic import here)
         for file_path in files:
             if all(local_track.path != file_path for local_track in self.local_tracks.values()):
-                self.logger.debug(f"Unindexed file: {file_path}")
+                self.logger.debug("Unindexed file: %s", file_path)
 
         await self.save_index()
 
@@ -780,6 +927,19 @@ class TrackManager:
             track_id: Track ID
             downloaded: Whether the track has been downloaded
         """
+        await self.update_album_track_statuses(album_id, [track_id], downloaded)
+
+    async def update_album_track_statuses(
+        self, album_id: str, track_ids: Iterable[str], downloaded: bool = True
+    ) -> None:
+        """
+        Update the status of several tracks in an album with a single save.
+
+        Args:
+            album_id: Album ID
+            track_ids: Track IDs
+            downloaded: Whether the tracks have been downloaded
+        """
         await self._load_state()
 
         if album_id not in self.album_statuses:
@@ -789,12 +949,10 @@ class TrackManager:
         status = self.album_statuses[album_id]
 
         if downloaded:
-            status.downloaded_track_ids.add(track_id)
-            status.downloaded_tracks = len(status.downloaded_track_ids)
+            status.downloaded_track_ids.update(track_ids)
         else:
-            if track_id in status.downloaded_track_ids:
-                status.downloaded_track_ids.remove(track_id)
-                status.downloaded_tracks = len(status.downloaded_track_ids)
+            status.downloaded_track_ids.difference_update(track_ids)
+        status.downloaded_tracks = len(status.downloaded_track_ids)
 
         status.last_updated = time.time()
 
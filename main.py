@@ -79,6 +79,15 @@ async def main() -> int:
     return await cli.start()
 
 
+def install_event_loop() -> None:
+    """Use uvloop for the asyncio event loop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
+
+
 def main_cli() -> None:
     """
     Entry point for the command-line interface.
@@ -86,6 +95,7 @@ def main_cli() -> None:
     This function is used as the entry point for the console_scripts
     in setup.py. It wraps the async main function and handles exceptions.
     """
+    install_event_loop()
     try:
         sys.exit(asyncio.run(main()))
     except KeyboardInterrupt:
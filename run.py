@@ -18,9 +18,10 @@ current_dir = Path(__file__).parent
 sys.path.insert(0, str(current_dir.parent))
 
 # Import the main function from the package
-from riptidal.main import main
+from riptidal.main import install_event_loop, main
 
 if __name__ == "__main__":
+    install_event_loop()
     try:
         sys.exit(asyncio.run(main()))
     except KeyboardInterrupt:
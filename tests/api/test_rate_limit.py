@@ -0,0 +1,40 @@
+import time
+
+import pytest
+
+from riptidal.api.rate_limit import AdaptiveRateGate
+
+
+def test_penalize_halves_rate_down_to_minimum():
+    gate = AdaptiveRateGate(max_rate=8.0, min_rate=1.0)
+    gate.penalize()
+    assert gate.rate == 4.0
+    for _ in range(5):
+        gate.penalize()
+    assert gate.rate == 1.0
+
+def test_reward_recovers_up_to_maximum():
+    gate = AdaptiveRateGate(max_rate=4.0, min_rate=1.0, recovery_step=1.0)
+    gate.penalize()
+    gate.reward()
+    assert gate.rate == 3.0
+    gate.reward()
+    gate.reward()
+    assert gate.rate == 4.0
+
+@pytest.mark.asyncio
+async def test_acquire_spaces_requests():
+    gate = AdaptiveRateGate(max_rate=20.0)
+    start = time.monotonic()
+    for _ in range(3):
+        await gate.acquire()
+    # First slot is immediate, the next two are 50 ms apart
+    assert time.monotonic() - start >= 0.09
+
+@pytest.mark.asyncio
+async def test_penalize_with_retry_after_delays_next_slot():
+    gate = AdaptiveRateGate(max_rate=100.0)
+    gate.penalize(retry_after=0.1)
+    start = time.monotonic()
+    await gate.acquire()
+    assert time.monotonic() - start >= 0.09
@@ -0,0 +1,34 @@
+import time
+
+import pytest
+
+from riptidal.api.response_cache import ResponseCache
+
+
+@pytest.mark.asyncio
+async def test_response_cache_roundtrip_and_delete(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite", expire_after=60)
+    key = ResponseCache.make_key("search/tracks", {"query": "Artist Title", "limit": 20})
+
+    assert await cache.get(key) is None
+    await cache.set(key, {"items": [{"id": 1}]})
+    assert await cache.get(key) == {"items": [{"id": 1}]}
+
+    await cache.delete(key)
+    assert await cache.get(key) is None
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_response_cache_expires_entries(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path / "cache.sqlite", expire_after=10)
+    await cache.set("key", {"items": []})
+
+    now = time.time()
+    monkeypatch.setattr("riptidal.api.response_cache.time.time", lambda: now + 11)
+    assert await cache.get("key") is None
+    cache.close()
+
+
+def test_make_key_is_independent_of_param_order():
+    assert ResponseCache.make_key("url", {"a": 1, "b": "x"}) == ResponseCache.make_key("url", {"b": "x", "a": 1})
@@ -0,0 +1,81 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from riptidal.core.library_scanner import LibraryScanner, LibraryStatistics, LibraryTrack
+
+
+@pytest.mark.asyncio
+async def test_scan_directory_yields_supported_files(tmp_path):
+    """scan_directory streams tracks for supported, non-hidden files only."""
+    album_dir = tmp_path / "Artist" / "Album"
+    album_dir.mkdir(parents=True)
+    (album_dir / "01 - Song.flac").write_bytes(b"not really audio")
+    (album_dir / "cover.jpg").write_bytes(b"image")
+    (album_dir / ".hidden.mp3").write_bytes(b"hidden")
+    hidden_dir = tmp_path / ".cache"
+    hidden_dir.mkdir()
+    (hidden_dir / "skip.mp3").write_bytes(b"skip")
+
+    scanner = LibraryScanner()
+    tracks = [track async for track in scanner.scan_directory(tmp_path)]
+
+    assert [t.file_path.name for t in tracks] == ["01 - Song.flac"]
+
+
+def test_library_statistics_matches_get_statistics():
+    """Running statistics agree with the list-based get_statistics."""
+    tracks = [
+        LibraryTrack(file_path=Path("a.flac"), artist="A", album="X", format="flac", file_size=1024, isrc="US1"),
+        LibraryTrack(file_path=Path("b.flac"), artist="A", album="X", format="flac", file_size=2048),
+        LibraryTrack(file_path=Path("c.mp3"), artist="B", album="Y", format="mp3", file_size=512, musicbrainz_id="mb"),
+    ]
+
+    stats = LibraryStatistics()
+    for track in tracks:
+        stats.add(track)
+
+    assert stats.as_dict() == LibraryScanner().get_statistics(tracks)
+    assert stats.as_dict()['total_albums'] == 2
+    assert stats.as_dict()['formats'] == {'flac': 2, 'mp3': 1}
+
+
+@pytest.mark.asyncio
+async def test_scan_directory_reuses_cached_metadata(tmp_path):
+    """Unchanged files are served from the scan cache without re-reading tags."""
+    library = tmp_path / "library"
+    library.mkdir()
+    song = library / "song.mp3"
+    song.write_bytes(b"not really audio")
+    cache_path = tmp_path / "scan.sqlite"
+
+    scanner = LibraryScanner(cache_path=cache_path)
+    first = [track async for track in scanner.scan_directory(library)]
+    assert cache_path.exists()
+
+    scanner = LibraryScanner(cache_path=cache_path)
+    with patch.object(scanner, "_extract_metadata") as extract:
+        second = [track async for track in scanner.scan_directory(library)]
+    extract.assert_not_called()
+    assert second == first
+
+    # A modified file is read again
+    song.write_bytes(b"different length audio data")
+    scanner = LibraryScanner(cache_path=cache_path)
+    third = [track async for track in scanner.scan_directory(library)]
+    assert third[0].file_size == song.stat().st_size
+
+
+@pytest.mark.asyncio
+async def test_get_statistics_tracks_last_scan(tmp_path):
+    """get_statistics() without arguments reports the counters gathered while scanning."""
+    (tmp_path / "a.mp3").write_bytes(b"a")
+    (tmp_path / "b.flac").write_bytes(b"bb")
+
+    scanner = LibraryScanner()
+    tracks = [track async for track in scanner.scan_directory(tmp_path)]
+
+    stats = scanner.get_statistics()
+    assert stats == scanner.get_statistics(tracks)
+    assert stats['total_tracks'] == 2
@@ -141,3 +141,56 @@ def test_settings_path_validators(mock_get_project_root, tmp_path):
 
     settings5_default = Settings()
     assert settings5_default.playlist_path_format == "Playlists/{playlist_name}"
+
+
+def test_save_settings_is_atomic_and_honors_sync_policy(tmp_path):
+    """Saving writes through a temp file and only fsyncs when the policy asks for it."""
+    from riptidal.core.settings import SyncPolicy
+
+    config_file = tmp_path / "settings.json"
+    settings = Settings(download_path=tmp_path / "Downloads", sync_policy=SyncPolicy.NEVER)
+
+    with patch('riptidal.core.settings.os.fsync') as fsync:
+        save_settings(settings, config_file)
+        fsync.assert_not_called()
+
+        settings.sync_policy = SyncPolicy.ALWAYS
+        save_settings(settings, config_file)
+        fsync.assert_called_once()
+
+    assert not (tmp_path / "settings.json.tmp").exists()
+    assert load_settings(config_file).sync_policy == SyncPolicy.ALWAYS
+
+
+def test_interval_sync_policy_flushes_skipped_write_at_exit(tmp_path):
+    """A save coalesced away by SyncPolicy.INTERVAL is still fsynced by the exit hook."""
+    from riptidal.core import settings as settings_module
+    from riptidal.core.settings import SyncPolicy
+
+    config_file = tmp_path / "settings.json"
+    settings = Settings(download_path=tmp_path / "Downloads", sync_policy=SyncPolicy.INTERVAL)
+
+    with patch('riptidal.core.settings.os.fsync') as fsync, \
+            patch('riptidal.core.settings.time.monotonic', return_value=1000.0):
+        settings_module._last_fsync = 0.0
+        save_settings(settings, config_file)
+        save_settings(settings, config_file)
+        assert fsync.call_count == 1
+        assert settings_module._pending_fsync == config_file
+
+        settings_module._flush_pending_fsync()
+        assert fsync.call_count == 2
+        assert settings_module._pending_fsync is None
+
+
+def test_save_settings_removes_temp_file_on_failure(tmp_path):
+    """A failed replace does not leave settings.json.tmp behind."""
+    config_file = tmp_path / "settings.json"
+    settings = Settings(download_path=tmp_path / "Downloads")
+
+    with patch('riptidal.core.settings.os.replace', side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            save_settings(settings, config_file)
+
+    assert not (tmp_path / "settings.json.tmp").exists()
+    assert not config_file.exists()
@@ -241,6 +241,36 @@ async def test_check_track_exists_not_in_index(track_manager):
     assert exists is False
     assert path is None
 
+@pytest.mark.asyncio
+async def test_check_tracks_exist_batch(track_manager, mock_settings):
+    """Batch lookup resolves indexed and unknown IDs in one call."""
+    await track_manager._load_state()
+    known_path = mock_settings.download_path / "known.flac"
+    track_manager.local_tracks["known_1"] = LocalTrack(id="known_1", path=known_path)
+
+    results = await track_manager.check_tracks_exist(["known_1", "unknown_2"])
+    assert results == {"known_1": (True, known_path), "unknown_2": (False, None)}
+
+@pytest.mark.asyncio
+async def test_add_tracks_bulk_saves_once(track_manager, mock_settings):
+    """Bulk add indexes every entry and persists state a single time."""
+    entries = [
+        {"track_id": "bulk_1", "path": mock_settings.download_path / "a.flac",
+         "isrc": "ISRC1", "allow_missing_file": True},
+        {"track_id": "bulk_2", "path": mock_settings.download_path / "b.flac",
+         "allow_missing_file": True},
+        {"track_id": "bulk_3", "path": mock_settings.download_path / "missing.flac"},
+    ]
+    with patch.object(track_manager, "_save_state_atomic") as mock_save:
+        mock_save.return_value = None
+        added = await track_manager.add_tracks_bulk(entries)
+
+    assert added == 2
+    mock_save.assert_awaited_once()
+    assert {"bulk_1", "bulk_2"} <= set(track_manager.local_tracks)
+    assert "bulk_3" not in track_manager.local_tracks
+    assert track_manager._state["tracks"]["bulk_1"]["isrc"] == "ISRC1"
+
 
 # Tests for Album Status Management
 @pytest.mark.asyncio
@@ -327,6 +357,22 @@ async def test_update_album_track_status_downloaded(track_manager):
     assert status.is_complete is True
     assert status.status == "completed"
 
+@pytest.mark.asyncio
+async def test_update_album_track_statuses_batch(track_manager):
+    """Test marking several album tracks downloaded in one call."""
+    mock_track1 = MagicMock(spec=ApiTrack); mock_track1.id = "trackC"
+    mock_track2 = MagicMock(spec=ApiTrack); mock_track2.id = "trackD"
+    mock_album = MagicMock(spec=ApiAlbum)
+    mock_album.id = "album790"; mock_album.title = "Batch Test Album"; mock_album.tracks = [mock_track1, mock_track2]
+    await track_manager.add_album_status(mock_album)
+
+    await track_manager.update_album_track_statuses("album790", ["trackC", "trackD"], True)
+
+    status = track_manager.album_statuses["album790"]
+    assert status.downloaded_track_ids == {"trackC", "trackD"}
+    assert status.downloaded_tracks == 2
+    assert status.status == "completed"
+
 @pytest.mark.asyncio
 async def test_get_incomplete_albums(track_manager):
     """Test retrieving incomplete albums."""
@@ -0,0 +1,44 @@
+import pytest
+
+from riptidal.ui.handlers.library_upgrade_handler import _title_similarity
+
+
+def test_title_similarity_paths_agree_on_partial_titles():
+    """The rapidfuzz and word-overlap paths score a partial title on the same scale."""
+    pytest.importorskip("rapidfuzz")
+
+    overlap = _title_similarity("love", "love me do", use_fuzzy=False)
+    fuzzy = _title_similarity("love", "love me do", use_fuzzy=True)
+
+    assert overlap == pytest.approx(1 / 3)
+    # A single shared word must not count as a full title match
+    assert fuzzy < 0.6
+    assert abs(fuzzy - overlap) < 0.25
+
+    assert _title_similarity("love me do", "love me do", use_fuzzy=False) == 1.0
+    assert _title_similarity("love me do", "love me do", use_fuzzy=True) == 1.0
+
+
+@pytest.mark.asyncio
+async def test_run_search_scores_past_partial_title_matches():
+    """A later exact title match beats an earlier high-scoring partial match."""
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock, MagicMock
+
+    from riptidal.ui.handlers.library_upgrade_handler import LibraryUpgradeHandler
+
+    items = [
+        {"title": "Lovely", "artists": [{"name": "Beatles"}]},
+        {"title": "Love", "artists": [{"name": "Beatles"}]},
+    ]
+    handler = LibraryUpgradeHandler.__new__(LibraryUpgradeHandler)
+    handler.logger = MagicMock()
+    handler.client = MagicMock()
+    handler.client.search = AsyncMock(return_value=SimpleNamespace(tracks={"items": items}))
+    handler.client._parse_model = lambda data, model: SimpleNamespace(
+        title=data["title"], artist_names=data["artists"][0]["name"]
+    )
+
+    track = await handler._run_search("Beatles Love", min_score=0.5)
+
+    assert track.title == "Love"
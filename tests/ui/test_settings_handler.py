@@ -0,0 +1,26 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from riptidal.core.settings import Settings
+from riptidal.ui.handlers.settings_handler import SettingsHandler
+
+
+@pytest.mark.asyncio
+async def test_close_closes_cached_clients_except_active(tmp_path):
+    """Cached clients for inactive API keys are closed; the active one is left to the CLI."""
+    active = MagicMock(close=AsyncMock())
+    inactive = MagicMock(close=AsyncMock())
+    cli = SimpleNamespace(client=active)
+    handler = SettingsHandler(Settings(download_path=tmp_path), MagicMock(), cli)
+    handler._client_cache = {
+        0: (inactive, MagicMock(), MagicMock()),
+        1: (active, MagicMock(), MagicMock()),
+    }
+
+    await handler.close()
+
+    inactive.close.assert_awaited_once()
+    active.close.assert_not_awaited()
+    assert handler._client_cache == {}
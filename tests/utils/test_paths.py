@@ -20,6 +20,16 @@ def test_default_paths_generation(mock_get_project_root, temp_project_root):
     assert get_data_dir() == temp_project_root / ".data"     # Changed to get_data_dir
     assert get_cache_dir() == temp_project_root / ".cache"   # Changed to get_cache_dir
 
+@patch('riptidal.utils.paths.get_project_root')
+def test_project_dirs_created_once(mock_get_project_root, temp_project_root):
+    mock_get_project_root.return_value = temp_project_root
+
+    cache_dir = get_cache_dir()
+    cache_dir.rmdir()
+    # The directory is only created on the first call for a given project root
+    assert get_cache_dir() == cache_dir
+    assert not cache_dir.exists()
+
 
 def test_sanitize_filename_basic():
     assert paths.sanitize_filename("Valid Name 123.mp3") == "Valid Name 123.mp3"
@@ -50,3 +60,15 @@ def test_sanitize_filename_dots():
     assert paths.sanitize_filename("...leadingdots.txt") == "leadingdots.txt"
     # Windows might have issues with filenames ending in a dot.
     assert paths.sanitize_filename("trailingdot.") == "trailingdot"
+
+def test_sanitize_filename_long_name_keeps_extension():
+    result = paths.sanitize_filename("a" * 300 + ".flac")
+    assert len(result) == 250
+    assert result.endswith("a.flac")
+    # Overlong "extensions" are not preserved
+    assert paths.sanitize_filename("a" * 300 + "." + "x" * 11) == "a" * 250
+
+def test_format_path_substitutes_and_sanitizes(tmp_path):
+    data = {"artist_name": "AC/DC", "album_name": "Back in Black", "track_number": "01", "album_year": None}
+    result = paths.format_path("{artist_name}/{album_name}{album_year}/{track_number} - {unknown}", data, tmp_path)
+    assert result == tmp_path / "AC_DC" / "Back in Black" / "01 - "
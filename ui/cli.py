@@ -135,6 +135,7 @@ class CLI:
 
     async def handle_api_key_selection(self) -> None:
         await self.settings_handler.handle_api_key_selection()
+        self.settings_handler.save_if_dirty()
 
     async def handle_settings(self) -> None:
         await self.settings_handler.handle_settings()
@@ -550,6 +551,7 @@ class CLI:
             exit_code = 1
         finally:
             self.progress_manager.stop_display()
+            await self.settings_handler.close()
             await self.client.close()
             
         return exit_code
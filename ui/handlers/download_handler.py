@@ -1,8 +1,12 @@
 """
 Handles download-related actions for the CLI.
 """
+import asyncio
 import os
-from typing import TYPE_CHECKING, List, Optional
+import sys
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 from pathlib import Path
 
 from riptidal.api.client import TidalClient
@@ -10,7 +14,7 @@ from riptidal.api.models import Track, Album, Artist, Video
 from riptidal.core.download_models import DownloadResult
 from riptidal.core.settings import Settings
 from riptidal.core.track_manager import TrackManager
-from riptidal.ui.input_utils import get_yes_no
+from riptidal.ui.input_utils import get_input, get_yes_no
 from riptidal.utils.logger import get_logger
 from riptidal.utils.paths import sanitize_filename
 
@@ -19,6 +23,38 @@ if TYPE_CHECKING:
     from riptidal.ui.progress_display import RichProgressManager
     from riptidal.core.downloader import BatchDownloader # Ensure BatchDownloader is available for type hint
 
+def _write_lines(*lines: str) -> None:
+    """Write a block of lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _safe_size(p: Path) -> int:
+    """Return the size of a file in bytes, or 0 if it does not exist."""
+    try:
+        return p.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def _partition(
+    results: List[DownloadResult],
+) -> Tuple[List[DownloadResult], List[DownloadResult], List[DownloadResult]]:
+    """Split results into (successful, skipped, failed) lists in a single pass."""
+    successful: List[DownloadResult] = []
+    skipped: List[DownloadResult] = []
+    failed: List[DownloadResult] = []
+    for r in results:
+        (skipped if r.skipped else successful if r.success else failed).append(r)
+    return successful, skipped, failed
+
+
+def _tally(results: List[DownloadResult]) -> Tuple[int, int, int]:
+    """Count (successful, skipped, failed) results in a single pass."""
+    successful, skipped, failed = _partition(results)
+    return len(successful), len(skipped), len(failed)
+
+
 class DownloadHandler:
     def __init__(
         self,
@@ -50,6 +86,12 @@ class DownloadHandler:
         self.logger = get_logger(__name__)
         
         self._incomplete_albums_loaded = False
+        # Playlist directory already created by create_complete_m3u_playlist (None if not yet)
+        self._m3u_dir_ready: Optional[Path] = None
+        # Parsed artist album/EP lists keyed by (artist_id, kind) -> (fetched_at, albums)
+        self._artist_albums_cache: Dict[Tuple[str, str], Tuple[float, List[Album]]] = {}
+        # Album track metadata keyed by (album_id, album_index, total_albums, track_ids)
+        self._album_meta_cache: Dict[tuple, Dict[str, Dict[str, Any]]] = {}
 
     def _get_track_path(self, track: Track, album: Optional[Album] = None) -> Path:
         """
@@ -77,6 +119,30 @@ class DownloadHandler:
         path = format_path(self.settings.track_path_format, data, self.settings.download_path)
         return path.with_suffix(".flac")  # Assuming FLAC for now
     
+    def _get_album_track_metadata(
+        self, album: Album, album_index: int, total_albums: int
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-track metadata for an album download, reusing earlier results.
+        
+        The key includes the album's (possibly filtered) track IDs, since the
+        metadata depends on which tracks are being downloaded.
+        """
+        key = (album.id, album_index, total_albums, tuple(str(t.id) for t in album.tracks))
+        track_metadata = self._album_meta_cache.get(key)
+        if track_metadata is None:
+            if len(self._album_meta_cache) >= 1024:
+                self._album_meta_cache.clear()
+            track_metadata = self.batch_downloader.album_handler.prepare_album_track_metadata(
+                album, album_index, total_albums, set()
+            )
+            self._album_meta_cache[key] = track_metadata
+        return track_metadata
+    
+    def _get_track_paths(self, tracks: List[Track]) -> List[Path]:
+        """Predict paths for a chunk of tracks (runs in a worker thread)."""
+        return [self._get_track_path(track, track.album) for track in tracks]
+    
     async def create_complete_m3u_playlist(self, name: str, tracks: List[Track]) -> None:
         """
         Creates a complete M3U playlist file with all tracks (both existing and to-be-downloaded).
@@ -90,20 +156,32 @@ class DownloadHandler:
             return
         
         playlist_dir = self.settings.download_path / "Playlists"
-        playlist_dir.mkdir(parents=True, exist_ok=True)
+        if self._m3u_dir_ready != playlist_dir:
+            playlist_dir.mkdir(parents=True, exist_ok=True)
+            self._m3u_dir_ready = playlist_dir
         playlist_file = playlist_dir / f"{sanitize_filename(name)}.m3u"
         
         try:
+            # Check which tracks are already downloaded in one lookup
+            lookup = await self.track_manager.check_tracks_exist([track.id for track in tracks])
+            paths = {str(tid): path for tid, (exists, path) in lookup.items() if exists}
+            
+            # Tracks not downloaded yet use predicted paths, computed in worker threads in chunks
+            missing = [track for track in tracks if str(track.id) not in paths]
+            chunk_size = 256
+            chunks = [missing[i:i + chunk_size] for i in range(0, len(missing), chunk_size)]
+            predicted = await asyncio.gather(
+                *(asyncio.to_thread(self._get_track_paths, chunk) for chunk in chunks)
+            )
+            for chunk, chunk_paths in zip(chunks, predicted):
+                for track, path in zip(chunk, chunk_paths):
+                    paths[str(track.id)] = path
+            
             with open(playlist_file, "w", encoding="utf-8") as f:
                 f.write("#EXTM3U\n")
                 
                 for track in tracks:
-                    # Check if track is already downloaded
-                    exists, path = await self.track_manager.check_track_exists(track.id)
-                    
-                    if not exists:
-                        # Track not downloaded yet, use predicted path
-                        path = self._get_track_path(track, track.album)
+                    path = paths[str(track.id)]
                     
                     # Use relative path in the M3U file
                     rel_path = os.path.relpath(path, self.settings.download_path)
@@ -166,32 +244,35 @@ class DownloadHandler:
         """
         Print a missing summary for a specific album. Returns the missing count.
         """
-        missing = 0
+        # Albums already marked completed in the index need no per-track comparison
+        st = self.track_manager.album_statuses.get(str(album.id))
+        if st and st.status == "completed":
+            print(f"All tracks in album '{album.title}' already downloaded.")
+            return 0
+        
         try:
             if hasattr(self.track_manager, "get_missing_for_album"):
                 total, missing, sample = await self.track_manager.get_missing_for_album(album)
             else:
                 # Fallback: compute via compare_tracks on album tracks
-                tracks = getattr(album, "tracks", []) or []
+                tracks = album.tracks or []
                 new_tracks, _ = await self.track_manager.compare_tracks(tracks)
                 total = len(tracks)
                 missing = len(new_tracks)
                 sample = new_tracks[:10]
-            
-            if missing == 0:
-                print(f"All tracks in album '{album.title}' already downloaded.")
-            else:
-                print(f"Album '{album.title}': Missing {missing} of {total} tracks.")
-                print("Sample of missing (up to 10):")
-                for t in sample:
-                    try:
-                        artist = t.artist_names or "Unknown Artist"
-                    except Exception:
-                        artist = "Unknown Artist"
-                    title = getattr(t, "title", None) or "Unknown Title"
-                    print(f"  - {artist} — {title}")
         except Exception as e:
-            self.logger.error(f"Error printing album missing summary for '{getattr(album, 'title', 'Unknown')}': {e}", exc_info=True)
+            self.logger.error(f"Error printing album missing summary for '{album.title}': {e}", exc_info=True)
+            return 0
+        
+        if missing == 0:
+            print(f"All tracks in album '{album.title}' already downloaded.")
+        else:
+            print(f"Album '{album.title}': Missing {missing} of {total} tracks.")
+            print("Sample of missing (up to 10):")
+            for t in sample:
+                artist = t.artist_names or "Unknown Artist"
+                title = t.title or "Unknown Title"
+                print(f"  - {artist} — {title}")
         return missing
 
     async def handle_download_favorites(self) -> None:
@@ -265,28 +346,29 @@ class DownloadHandler:
         
         self.progress_manager.stop_display()
 
-        success = sum(1 for r in results if r.success and not r.skipped)
-        skipped = sum(1 for r in results if r.skipped)
-        failed = sum(1 for r in results if not r.success and not r.skipped)
-        
-        print("\n=== Download Summary (Favorites) ===")
-        print(f"Downloaded: {success}")
-        print(f"Skipped: {skipped}")
-        print(f"Failed: {failed}")
+        successful, skipped_r, failed_r = _partition(results)
+        success, skipped, failed = len(successful), len(skipped_r), len(failed_r)
+        
+        _write_lines(
+            "\n=== Download Summary (Favorites) ===",
+            f"Downloaded: {success}",
+            f"Skipped: {skipped}",
+            f"Failed: {failed}",
+        )
         
         self.logger.info(f"Download operation complete for favorites. Processing {len(results)} results for track index.")
-        successful_downloads_fav = 0
-        for result in results:
-            if result.success and not result.skipped and result.file_path:
-                successful_downloads_fav += 1
-                self.logger.debug(f"Calling track_manager.add_track for favorite track ID: {result.track.id}, path: {result.file_path}")
-                await self.track_manager.add_track(result.track.id, result.file_path)
+        entries = [
+            {"track_id": str(r.track.id), "path": r.file_path}
+            for r in successful if r.file_path
+        ]
+        successful_downloads_fav = len(entries)
+        await self.track_manager.add_tracks_bulk(entries)
         self.logger.info(f"Attempted to add {successful_downloads_fav} favorite tracks to index.")
         
         # Save unified library and report
         final_track_count = len(self.track_manager.local_tracks)
         await self.track_manager.save_index()
-        size_bytes = self.track_manager.state_path.stat().st_size if self.track_manager.state_path.exists() else 0
+        size_bytes = _safe_size(self.track_manager.state_path)
         print(f"Unified library now has {final_track_count} tracks")
         print(f"Unified library file: {self.track_manager.state_path} (size: {size_bytes} bytes)")
         
@@ -295,7 +377,6 @@ class DownloadHandler:
     
     async def handle_download_favorite_albums(self) -> None:
         """Handles downloading favorite albums."""
-        from riptidal.ui.input_utils import get_input # Local import for this method only
         
         self.progress_manager.stop_display()
         print("\n=== Download Favorite Albums ===")
@@ -407,9 +488,7 @@ class DownloadHandler:
             
             # Download album
             albums_map = {album_obj.id: album_obj}
-            track_metadata = self.batch_downloader.album_handler.prepare_album_track_metadata(
-                album_obj, i+1, len(albums_to_process), set()
-            )
+            track_metadata = self._get_album_track_metadata(album_obj, i+1, len(albums_to_process))
             
             results = await self.batch_downloader.download_tracks(
                 album_obj.tracks, albums_map, is_album_download=True, track_metadata=track_metadata
@@ -417,39 +496,41 @@ class DownloadHandler:
             
             self.progress_manager.stop_display()
             
-            success = sum(1 for r in results if r.success and not r.skipped)
-            skipped = sum(1 for r in results if r.skipped)
-            failed = sum(1 for r in results if not r.success and not r.skipped)
+            successful, skipped_r, failed_r = _partition(results)
+            success, skipped, failed = len(successful), len(skipped_r), len(failed_r)
             
             total_downloaded_all_albums += success
             total_skipped_all_albums += skipped
             total_failed_all_albums += failed
             
-            print(f"\n--- Summary for Album: {album_obj.title} ---")
-            print(f"Downloaded: {success}")
-            print(f"Skipped: {skipped}")
-            print(f"Failed: {failed}")
+            _write_lines(
+                f"\n--- Summary for Album: {album_obj.title} ---",
+                f"Downloaded: {success}",
+                f"Skipped: {skipped}",
+                f"Failed: {failed}",
+            )
             
-            # Update album status
-            for result in results:
-                if result.success and not result.skipped and result.file_path:
-                    self.logger.debug(f"Calling track_manager.add_track for album track ID: {result.track.id}, path: {result.file_path}")
-                    await self.track_manager.add_track(result.track.id, result.file_path)
-                    
-                    # Update album status
-                    if album_obj.id in self.track_manager.album_statuses:
-                        await self.track_manager.update_album_track_status(album_obj.id, str(result.track.id), True)
+            # Add downloaded tracks to the index in one batch, then update album status
+            downloaded = [r for r in successful if r.file_path]
+            await self.track_manager.add_tracks_bulk(
+                [{"track_id": str(r.track.id), "path": r.file_path} for r in downloaded]
+            )
+            if album_obj.id in self.track_manager.album_statuses:
+                await self.track_manager.update_album_track_statuses(
+                    album_obj.id, [str(r.track.id) for r in downloaded], True
+                )
         
         if len(albums_to_process) > 1:
-            print("\n=== Overall Download Summary (All Processed Albums) ===")
-            print(f"Total Albums Processed: {len(albums_to_process)}")
-            print(f"Total Downloaded: {total_downloaded_all_albums}")
-            print(f"Total Skipped: {total_skipped_all_albums}")
-            print(f"Total Failed: {total_failed_all_albums}")
+            _write_lines(
+                "\n=== Overall Download Summary (All Processed Albums) ===",
+                f"Total Albums Processed: {len(albums_to_process)}",
+                f"Total Downloaded: {total_downloaded_all_albums}",
+                f"Total Skipped: {total_skipped_all_albums}",
+                f"Total Failed: {total_failed_all_albums}",
+            )
     
     async def handle_download_favorite_artists(self) -> None:
         """Handles downloading albums from favorite artists."""
-        from riptidal.ui.input_utils import get_input # Local import for this method only
         
         self.progress_manager.stop_display()
         print("\n=== Download Favorite Artists ===")
@@ -509,6 +590,7 @@ class DownloadHandler:
             
             # First get main albums and optionally EPs/singles
             artist_albums = []
+            next_album_task: Optional[asyncio.Task] = None
             try:
                 # Get albums from the API
                 albums_data = await self._get_artist_albums(artist_to_download.id)
@@ -549,7 +631,12 @@ class DownloadHandler:
                     if not await get_yes_no(confirm_text, True):
                         continue
                 
-                # Process each album
+                # Process each album, fetching the next album's details in the background
+                # while the current one downloads (one-slot lookahead)
+                album_handler = self.batch_downloader.album_handler
+                next_album_task = asyncio.create_task(
+                    album_handler.get_album_details_and_tracks(artist_albums[0].id)
+                )
                 for j, album in enumerate(artist_albums):
                     print(f"\n--- Processing Album {j+1}/{len(artist_albums)}: {album.title} ---")
                     
@@ -561,8 +648,12 @@ class DownloadHandler:
                             is_incomplete = True
                             print(f"Resuming incomplete album: {album_status.album_title} ({album_status.downloaded_tracks}/{album_status.total_tracks} tracks)")
                     
-                    # Get album details and tracks
-                    album_obj = await self.batch_downloader.album_handler.get_album_details_and_tracks(album.id)
+                    # Get album details and tracks (prefetched) and schedule the next album
+                    album_obj = await next_album_task
+                    if j + 1 < len(artist_albums):
+                        next_album_task = asyncio.create_task(
+                            album_handler.get_album_details_and_tracks(artist_albums[j + 1].id)
+                        )
                     
                     if not album_obj or not hasattr(album_obj, 'tracks') or not album_obj.tracks:
                         print(f"No tracks found for album '{album.title}'. Skipping.")
@@ -608,6 +699,7 @@ class DownloadHandler:
                         # Only confirm once for the first album when downloading all albums from a single artist
                         confirm_text = f"Download all {len(artist_albums)} albums from artist '{artist_to_download.name}'?"
                         if not await get_yes_no(confirm_text, True):
+                            next_album_task.cancel()
                             break  # Skip all albums from this artist
                     
                     self.progress_manager.reset_progress_state()
@@ -617,9 +709,7 @@ class DownloadHandler:
                     
                     # Download album
                     albums_map = {album_obj.id: album_obj}
-                    track_metadata = self.batch_downloader.album_handler.prepare_album_track_metadata(
-                        album_obj, j+1, len(artist_albums), set()
-                    )
+                    track_metadata = self._get_album_track_metadata(album_obj, j+1, len(artist_albums))
                     
                     results = await self.batch_downloader.download_tracks(
                         album_obj.tracks, albums_map, is_album_download=True, track_metadata=track_metadata
@@ -627,74 +717,111 @@ class DownloadHandler:
                     
                     self.progress_manager.stop_display()
                     
-                    success = sum(1 for r in results if r.success and not r.skipped)
-                    skipped = sum(1 for r in results if r.skipped)
-                    failed = sum(1 for r in results if not r.success and not r.skipped)
+                    successful, skipped_r, failed_r = _partition(results)
+                    success, skipped, failed = len(successful), len(skipped_r), len(failed_r)
                     
                     total_downloaded_all_artists += success
                     total_skipped_all_artists += skipped
                     total_failed_all_artists += failed
                     total_albums_processed += 1
                     
-                    print(f"\n--- Summary for Album: {album_obj.title} ---")
-                    print(f"Downloaded: {success}")
-                    print(f"Skipped: {skipped}")
-                    print(f"Failed: {failed}")
+                    _write_lines(
+                        f"\n--- Summary for Album: {album_obj.title} ---",
+                        f"Downloaded: {success}",
+                        f"Skipped: {skipped}",
+                        f"Failed: {failed}",
+                    )
                     
-                    # Update album status
-                    for result in results:
-                        if result.success and not result.skipped and result.file_path:
-                            self.logger.debug(f"Calling track_manager.add_track for album track ID: {result.track.id}, path: {result.file_path}")
-                            await self.track_manager.add_track(result.track.id, result.file_path)
-                            
-                            # Update album status
-                            if album_obj.id in self.track_manager.album_statuses:
-                                await self.track_manager.update_album_track_status(album_obj.id, str(result.track.id), True)
+                    # Add downloaded tracks to the index in one batch, then update album status
+                    downloaded = [r for r in successful if r.file_path]
+                    await self.track_manager.add_tracks_bulk(
+                        [{"track_id": str(r.track.id), "path": r.file_path} for r in downloaded]
+                    )
+                    if album_obj.id in self.track_manager.album_statuses:
+                        await self.track_manager.update_album_track_statuses(
+                            album_obj.id, [str(r.track.id) for r in downloaded], True
+                        )
             
             except Exception as e:
+                if next_album_task is not None and not next_album_task.done():
+                    next_album_task.cancel()
                 self.logger.error(f"Error processing artist {artist_to_download.name}: {str(e)}", exc_info=True)
                 print(f"Error processing artist {artist_to_download.name}: {str(e)}")
                 continue
         
         if len(artists_to_process) > 1:
-            print("\n=== Overall Download Summary (All Processed Artists) ===")
-            print(f"Total Artists Processed: {len(artists_to_process)}")
-            print(f"Total Albums Processed: {total_albums_processed}")
-            print(f"Total Downloaded: {total_downloaded_all_artists}")
-            print(f"Total Skipped: {total_skipped_all_artists}")
-            print(f"Total Failed: {total_failed_all_artists}")
+            _write_lines(
+                "\n=== Overall Download Summary (All Processed Artists) ===",
+                f"Total Artists Processed: {len(artists_to_process)}",
+                f"Total Albums Processed: {total_albums_processed}",
+                f"Total Downloaded: {total_downloaded_all_artists}",
+                f"Total Skipped: {total_skipped_all_artists}",
+                f"Total Failed: {total_failed_all_artists}",
+            )
     
-    async def _get_artist_albums(self, artist_id: str) -> List[Album]:
-        """Get albums for an artist."""
-        items = await self.client._get_items(f'artists/{artist_id}/albums')
+    ARTIST_ALBUMS_CACHE_TTL = 300  # seconds
+
+    def _get_cached_artist_albums(self, artist_id: str, kind: str) -> Optional[List[Album]]:
+        """Return a cached artist album list if still fresh."""
+        cached = self._artist_albums_cache.get((str(artist_id), kind))
+        if cached and time.time() - cached[0] < self.ARTIST_ALBUMS_CACHE_TTL:
+            return cached[1]
+        return None
+
+    def invalidate_artist_albums_cache(self, artist_id: Optional[str] = None) -> None:
+        """
+        Drop cached artist album/EP lists.
         
+        Args:
+            artist_id: Only invalidate this artist (all artists if None)
+        """
+        if artist_id is None:
+            self._artist_albums_cache.clear()
+            return
+        for kind in ("albums", "eps"):
+            self._artist_albums_cache.pop((str(artist_id), kind), None)
+
+    def _parse_albums(self, items: List[dict], label: str) -> List[Album]:
+        """Parse raw album items, skipping (and logging) invalid ones."""
         albums = []
         for item in items:
             try:
-                album = self.client._parse_model(item, Album)
-                albums.append(album)
+                albums.append(self.client._parse_model(item, Album))
             except Exception as e:
-                self.logger.error(f"Error processing album: {str(e)}")
+                self.logger.error(f"Error processing {label}: {str(e)}")
+        return albums
+
+    async def _get_artist_albums(self, artist_id: str) -> List[Album]:
+        """Get albums for an artist."""
+        cached = self._get_cached_artist_albums(artist_id, "albums")
+        if cached is not None:
+            return cached
+        
+        items = await self.client._get_items(f'artists/{artist_id}/albums')
+        
+        # Parse off the event loop so the progress display stays responsive
+        albums = await asyncio.to_thread(self._parse_albums, items, "album")
         
+        if albums:
+            self._artist_albums_cache[(str(artist_id), "albums")] = (time.time(), albums)
         return albums
     
     async def _get_artist_eps(self, artist_id: str) -> List[Album]:
         """Get EPs and singles for an artist."""
+        cached = self._get_cached_artist_albums(artist_id, "eps")
+        if cached is not None:
+            return cached
+        
         items = await self.client._get_items(f'artists/{artist_id}/albums', {"filter": "EPSANDSINGLES"})
         
-        eps = []
-        for item in items:
-            try:
-                album = self.client._parse_model(item, Album)
-                eps.append(album)
-            except Exception as e:
-                self.logger.error(f"Error processing EP/single: {str(e)}")
+        eps = await asyncio.to_thread(self._parse_albums, items, "EP/single")
         
+        if eps:
+            self._artist_albums_cache[(str(artist_id), "eps")] = (time.time(), eps)
         return eps
 
     async def handle_download_playlist(self) -> None:
         """Handles downloading tracks from a playlist."""
-        from riptidal.ui.input_utils import get_input # Local import for this method only
 
         self.progress_manager.stop_display()
         print("\n=== Download Playlist ===")
@@ -791,8 +918,9 @@ class DownloadHandler:
                  if not await get_yes_no(confirm_text, True):
                      continue # Skip this playlist
 
-            # Create M3U playlist at the beginning if requested
-            if create_m3u_for_all:
+            # Create M3U playlist at the beginning if requested; small deltas write it once after downloading
+            prewrite_m3u = create_m3u_for_all and len(new_tracks) >= self.settings.m3u_prewrite_threshold
+            if prewrite_m3u:
                 await self.create_complete_m3u_playlist(playlist_to_download.title, all_playlist_tracks)
 
             self.progress_manager.reset_progress_state()
@@ -806,44 +934,55 @@ class DownloadHandler:
             )
             self.progress_manager.stop_display()
 
-            success = sum(1 for r in results if r.success and not r.skipped)
-            skipped = sum(1 for r in results if r.skipped)
-            failed = sum(1 for r in results if not r.success and not r.skipped)
+            successful, skipped_r, failed_r = _partition(results)
+            success, skipped, failed = len(successful), len(skipped_r), len(failed_r)
             
             total_downloaded_all_playlists += success
             total_skipped_all_playlists += skipped
             total_failed_all_playlists += failed
 
-            print(f"\n--- Summary for Playlist: {playlist_to_download.title} ---")
-            print(f"Downloaded: {success}")
-            print(f"Skipped: {skipped}")
-            print(f"Failed: {failed}")
+            _write_lines(
+                f"\n--- Summary for Playlist: {playlist_to_download.title} ---",
+                f"Downloaded: {success}",
+                f"Skipped: {skipped}",
+                f"Failed: {failed}",
+            )
             
-            self.logger.debug(f"Processing {len(results)} results for playlist '{playlist_to_download.title}' for track index.")
-            successful_playlist_tracks = 0
-            for result in results:
-                if result.success and not result.skipped and result.file_path:
-                    successful_playlist_tracks +=1
-                    self.logger.debug(f"Calling track_manager.add_track for playlist track ID: {result.track.id}, path: {result.file_path}")
-                    await self.track_manager.add_track(result.track.id, result.file_path)
+            self.logger.debug("Processing %d results for playlist '%s' for track index.", len(results), playlist_to_download.title)
+            entries = [
+                {"track_id": str(r.track.id), "path": r.file_path}
+                for r in successful if r.file_path
+            ]
+            successful_playlist_tracks = len(entries)
+            await self.track_manager.add_tracks_bulk(entries)
             self.logger.info(f"Attempted to add {successful_playlist_tracks} tracks from playlist '{playlist_to_download.title}' to index.")
             
-            # Save unified library and report
+            # Report; the unified library is saved once after all playlists
             current_track_count = len(self.track_manager.local_tracks)
-            await self.track_manager.save_index()
-            size_bytes = self.track_manager.state_path.stat().st_size if self.track_manager.state_path.exists() else 0
             print(f"Unified library now has {current_track_count} tracks")
-            print(f"Unified library file: {self.track_manager.state_path} (size: {size_bytes} bytes)")
+            
+            checkpoint_interval = self.settings.playlist_checkpoint_interval
+            if checkpoint_interval and (i + 1) % checkpoint_interval == 0:
+                await self.track_manager.save_index()
             
             if create_m3u_for_all:
-                await self.create_m3u_playlist(playlist_to_download.title, all_playlist_tracks, results)
+                if prewrite_m3u:
+                    await self.create_m3u_playlist(playlist_to_download.title, all_playlist_tracks, results)
+                else:
+                    await self.create_complete_m3u_playlist(playlist_to_download.title, all_playlist_tracks)
+        
+        await self.track_manager.save_index()
+        size_bytes = _safe_size(self.track_manager.state_path)
+        print(f"Unified library file: {self.track_manager.state_path} (size: {size_bytes} bytes)")
         
         if len(playlists_to_process) > 1:
-            print("\n=== Overall Download Summary (All Processed Playlists) ===")
-            print(f"Total Playlists Processed: {len(playlists_to_process)}")
-            print(f"Total Downloaded: {total_downloaded_all_playlists}")
-            print(f"Total Skipped: {total_skipped_all_playlists}")
-            print(f"Total Failed: {total_failed_all_playlists}")
+            _write_lines(
+                "\n=== Overall Download Summary (All Processed Playlists) ===",
+                f"Total Playlists Processed: {len(playlists_to_process)}",
+                f"Total Downloaded: {total_downloaded_all_playlists}",
+                f"Total Skipped: {total_skipped_all_playlists}",
+                f"Total Failed: {total_failed_all_playlists}",
+            )
     
     async def _load_incomplete_albums(self) -> List['AlbumDownloadStatus']:
         """Load incomplete album statuses."""
@@ -886,14 +1025,14 @@ class DownloadHandler:
             
             self.progress_manager.stop_display()
             
-            success = sum(1 for r in results if r.success and not r.skipped)
-            skipped = sum(1 for r in results if r.skipped)
-            failed = sum(1 for r in results if not r.success and not r.skipped)
+            success, skipped, failed = _tally(results)
             
-            print("\n=== Download Summary (Favorite Videos) ===")
-            print(f"Downloaded: {success}")
-            print(f"Skipped: {skipped}")
-            print(f"Failed: {failed}")
+            _write_lines(
+                "\n=== Download Summary (Favorite Videos) ===",
+                f"Downloaded: {success}",
+                f"Skipped: {skipped}",
+                f"Failed: {failed}",
+            )
             
         except Exception as e:
             self.logger.error(f"Error downloading favorite videos: {str(e)}", exc_info=True)
@@ -901,7 +1040,6 @@ class DownloadHandler:
     
     async def handle_download_favorite_artist_videos(self) -> None:
         """Handles downloading videos from favorite artists."""
-        from riptidal.ui.input_utils import get_input # Local import for this method only
         
         self.progress_manager.stop_display()
         print("\n=== Download Favorite Artist Videos ===")
@@ -941,14 +1079,14 @@ class DownloadHandler:
                 
                 self.progress_manager.stop_display()
                 
-                success = sum(1 for r in results if r.success and not r.skipped)
-                skipped = sum(1 for r in results if r.skipped)
-                failed = sum(1 for r in results if not r.success and not r.skipped)
+                success, skipped, failed = _tally(results)
                 
-                print("\n=== Download Summary (All Favorite Artist Videos) ===")
-                print(f"Downloaded: {success}")
-                print(f"Skipped: {skipped}")
-                print(f"Failed: {failed}")
+                _write_lines(
+                    "\n=== Download Summary (All Favorite Artist Videos) ===",
+                    f"Downloaded: {success}",
+                    f"Skipped: {skipped}",
+                    f"Failed: {failed}",
+                )
                 
             else:
                 try:
@@ -977,14 +1115,14 @@ class DownloadHandler:
                         
                         self.progress_manager.stop_display()
                         
-                        success = sum(1 for r in results if r.success and not r.skipped)
-                        skipped = sum(1 for r in results if r.skipped)
-                        failed = sum(1 for r in results if not r.success and not r.skipped)
+                        success, skipped, failed = _tally(results)
                         
-                        print(f"\n=== Download Summary ({artist.name} Videos) ===")
-                        print(f"Downloaded: {success}")
-                        print(f"Skipped: {skipped}")
-                        print(f"Failed: {failed}")
+                        _write_lines(
+                            f"\n=== Download Summary ({artist.name} Videos) ===",
+                            f"Downloaded: {success}",
+                            f"Skipped: {skipped}",
+                            f"Failed: {failed}",
+                        )
                     else:
                         print("Invalid artist number.")
                 except ValueError:
@@ -993,9 +1131,35 @@ class DownloadHandler:
             self.logger.error(f"Error downloading favorite artist videos: {str(e)}", exc_info=True)
             print(f"Error downloading favorite artist videos: {str(e)}")
 
-    async def handle_recreate_library_from_favorites(self) -> None:
-        """Recreate unified library_state.json indexing all favorite tracks as if downloaded."""
-        from riptidal.ui.input_utils import get_yes_no
+    def _favorite_index_entries(self, tracks: List[Track], quality_name: str) -> List[Dict[str, Any]]:
+        """Build index-only add_tracks_bulk entries for favorite tracks (as if downloaded)."""
+        entries = []
+        for tr in tracks:
+            album = tr.album
+            album_id = album.id if album else None
+            # Predict path using current format (index-only, no actual files created)
+            entries.append({
+                "track_id": str(tr.id),
+                "path": self._get_track_path(tr, album),
+                "album_id": str(album_id) if album_id else None,
+                "album_title": album.title if album else None,
+                "artist_names": tr.artist_names,
+                "track_title": tr.title,
+                "isrc": tr.isrc,
+                "quality_requested": quality_name,
+                "source_favorites": True,
+                "allow_missing_file": True,  # index-only
+            })
+        return entries
+
+    async def handle_recreate_library_from_favorites(self, merge: Optional[bool] = None) -> None:
+        """
+        Recreate unified library_state.json indexing all favorite tracks as if downloaded.
+        
+        Args:
+            merge: Add favorites to the existing library instead of replacing it,
+                skipping tracks already indexed (asks if None)
+        """
 
         self.progress_manager.stop_display()
         print("\n=== Recreate Library From Favorites ===")
@@ -1005,78 +1169,101 @@ class DownloadHandler:
             return
 
         state_path = self.track_manager.state_path
-        print(f"This will replace the unified library file:\n  {state_path}")
-        if not await get_yes_no("Proceed and replace the current unified library?", False):
-            print("Operation cancelled.")
-            return
+        if merge is None:
+            merge = await get_yes_no("Merge favorites into the existing library instead of replacing it?", False)
+        if merge:
+            await self.track_manager.load_index()
+        else:
+            print(f"This will replace the unified library file:\n  {state_path}")
+            if not await get_yes_no("Proceed and replace the current unified library?", False):
+                print("Operation cancelled.")
+                return
 
         # Option to enrich album statuses with total_tracks and accurate downloaded sets
         fetch_album_details = await get_yes_no("Fetch album details for accurate album statuses?", True)
         delete_legacy = await get_yes_no("Delete legacy .data index files after recreation?", True)
 
+        index_changed = False
         try:
             print("Fetching favorite tracks...")
-            favorite_tracks = await self.client.get_favorite_tracks()
-            if not favorite_tracks:
+
+            # Build index entries page by page while aggregating by album. Every entry is held in
+            # memory and indexed in one bulk call after the last page, so a failed fetch never
+            # leaves a half-cleared index behind.
+            fav_by_album: Dict[str, Set[str]] = defaultdict(set)
+            total_favorites = 0
+            entries: List[Dict[str, Any]] = []
+            batch: List[Track] = []
+
+            quality_name = self.settings.audio_quality.name
+            # Already-indexed favorites keep their entries and skip path prediction
+            indexed = self.track_manager.local_tracks if merge else {}
+
+            def collect(tracks: List[Track]) -> None:
+                entries.extend(self._favorite_index_entries(
+                    [tr for tr in tracks if str(tr.id) not in indexed], quality_name
+                ))
+
+            async for tr in self.client.iter_favorite_tracks():
+                total_favorites += 1
+                aid = tr.album.id if tr.album else None
+                if aid:
+                    fav_by_album[str(aid)].add(str(tr.id))
+                batch.append(tr)
+                if len(batch) >= 500:
+                    collect(batch)
+                    batch.clear()
+            if batch:
+                collect(batch)
+            fav_by_album = dict(fav_by_album)
+
+            if not total_favorites:
                 print("No favorite tracks found.")
                 return
-            print(f"Found {len(favorite_tracks)} favorite tracks.")
 
-            # Clear unified state (with backup)
-            await self.track_manager.clear_all_indexes(backup=True)
+            index_changed = True
+            if not merge:
+                # Clear unified state (with backup) only once all favorites are fetched
+                await self.track_manager.clear_all_indexes(backup=True)
+                self.invalidate_artist_albums_cache()
+            added = await self.track_manager.add_tracks_bulk(entries)
+            print(f"Favorite tracks fetched: {total_favorites}")
 
             # Optionally prefetch album details
             albums_map = {}
             if fetch_album_details:
-                album_ids = {t.album.id for t in favorite_tracks if t.album and t.album.id}
+                album_ids = set(fav_by_album)
                 print(f"Fetching details for {len(album_ids)} unique albums...")
-                for aid in album_ids:
-                    try:
-                        album_obj = await self.batch_downloader.album_handler.get_album_details_and_tracks(aid)
-                        if album_obj:
-                            albums_map[aid] = album_obj
-                    except Exception as e:
-                        self.logger.warning(f"Failed to fetch album {aid}: {e}")
+                sem = asyncio.Semaphore(self.settings.max_concurrent_metadata or 8)
 
-            # Index all favorites as “downloaded”
-            added = 0
-            for tr in favorite_tracks:
-                # Predict path using current format (index-only, no actual files created)
-                predicted_path = self._get_track_path(tr, tr.album if hasattr(tr, "album") else None)
-                album_id = getattr(tr.album, "id", None) if hasattr(tr, "album") and tr.album else None
-                album_title = getattr(tr.album, "title", None) if hasattr(tr, "album") and tr.album else None
+                async def fetch(aid):
+                    async with sem:
+                        try:
+                            return aid, await self.batch_downloader.album_handler.get_album_details_and_tracks(aid)
+                        except Exception as e:
+                            self.logger.warning(f"Failed to fetch album {aid}: {e}")
+                            return aid, None
 
-                await self.track_manager.add_track(
-                    str(tr.id),
-                    predicted_path,
-                    album_id=str(album_id) if album_id else None,
-                    album_title=album_title,
-                    artist_names=getattr(tr, "artist_names", None),
-                    track_title=getattr(tr, "title", None),
-                    isrc=getattr(tr, "isrc", None),
-                    quality_requested=self.settings.audio_quality.name,
-                    source_favorites=True,
-                    allow_missing_file=True,  # index-only
-                )
-                added += 1
+                tasks = [asyncio.create_task(fetch(aid)) for aid in album_ids]
+                done = 0
+                for fut in asyncio.as_completed(tasks):
+                    aid, album_obj = await fut
+                    if album_obj:
+                        albums_map[aid] = album_obj
+                    done += 1
+                    if done % 25 == 0:
+                        print(f"Albums fetched {done}/{len(tasks)}")
 
             # Build album statuses if requested
             albums_built = 0
             if fetch_album_details and albums_map:
-                # Aggregate favorites by album
-                fav_by_album = {}
-                for tr in favorite_tracks:
-                    aid = getattr(tr.album, "id", None) if hasattr(tr, "album") and tr.album else None
-                    if not aid:
-                        continue
-                    fav_by_album.setdefault(str(aid), set()).add(str(tr.id))
-
                 for aid, album_obj in albums_map.items():
                     try:
                         status = await self.track_manager.add_album_status(album_obj)
                         # Mark favorite tracks from this album as downloaded
-                        for tr_id in fav_by_album.get(str(aid), set()):
-                            await self.track_manager.update_album_track_status(str(aid), tr_id, True)
+                        await self.track_manager.update_album_track_statuses(
+                            str(aid), fav_by_album.get(str(aid), set()), True
+                        )
                         albums_built += 1
                     except Exception as e:
                         self.logger.warning(f"Failed to build album status for {aid}: {e}")
@@ -1088,7 +1275,7 @@ class DownloadHandler:
             if delete_legacy:
                 await self.track_manager.delete_legacy_files()
 
-            size_bytes = state_path.stat().st_size if state_path.exists() else 0
+            size_bytes = _safe_size(state_path)
             print("\n=== Recreation Complete ===")
             print(f"Tracks indexed: {added}")
             if fetch_album_details:
@@ -1097,3 +1284,9 @@ class DownloadHandler:
         except Exception as e:
             self.logger.error(f"Error recreating library from favorites: {e}", exc_info=True)
             print(f"Error recreating library from favorites: {e}")
+            if index_changed and not merge:
+                print(f"The library index was left partially rebuilt. A backup of the previous state was saved next to {state_path}.")
+            elif index_changed:
+                print("The library index was left partially merged.")
+            else:
+                print("The library index was left unchanged.")
@@ -6,11 +6,23 @@ an existing music library to higher quality versions from Tidal.
 """
 
 import asyncio
+import re
+import time
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from itertools import groupby
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Any
+from typing import Iterator, List, Dict, Optional, Tuple, Any
+
+try:
+    from rapidfuzz import fuzz
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
 
 from riptidal.api.client import TidalClient
 from riptidal.api.musicbrainz_client import MusicBrainzClient, MusicBrainzRecording
+from riptidal.api.response_cache import ResponseCache
 from riptidal.api.models import Track, StreamQuality
 from riptidal.core.library_scanner import LibraryScanner, LibraryTrack
 from riptidal.core.downloader import BatchDownloader
@@ -19,26 +31,64 @@ from riptidal.core.track_manager import TrackManager
 from riptidal.ui.progress_display import RichProgressManager
 from riptidal.ui.input_utils import get_input, get_yes_no, get_choice
 from riptidal.utils.logger import get_logger
+from riptidal.utils.paths import get_cache_dir
+
+MUSICBRAINZ_CACHE_DAYS = 30
+
+# Patterns used by LibraryUpgradeHandler._clean_title
+_PAREN_RE = re.compile(r'\([^)]*\)')
+_BRACKET_RE = re.compile(r'\[[^\]]*\]')
+_BRACE_RE = re.compile(r'\{[^}]*\}')
+_NONWORD_RE = re.compile(r'[^\w\s]')
+_WS_RE = re.compile(r'\s+')
+
+
+def _raw_artist_names(track_data: Dict[str, Any]) -> List[str]:
+    """Get artist names from a raw track dict, mirroring Track.artist_names."""
+    artists = track_data.get('artists')
+    if artists:
+        return [artist.get('name', '') for artist in artists]
+    artist = track_data.get('artist')
+    if artist and artist.get('name'):
+        return [artist['name']]
+    return ["Unknown Artist"]
+
 
+def _title_similarity(query_title: str, track_title: str, use_fuzzy: bool) -> float:
+    """
+    Score how similar a search result title is to the queried title.
+    
+    Both paths return a value between 0 and 1 on the same scale: the share of
+    the longer title that matches the other one.
+    
+    Args:
+        query_title: Lowercased title from the search query
+        track_title: Lowercased title of the search result
+        use_fuzzy: Whether to use rapidfuzz instead of word overlap
+        
+    Returns:
+        Similarity between 0 and 1
+    """
+    if use_fuzzy:
+        return fuzz.token_sort_ratio(query_title, track_title) / 100
+    query_words = set(query_title.split())
+    track_words = set(track_title.split())
+    common_words = query_words & track_words
+    if not common_words:
+        return 0.0
+    return len(common_words) / max(len(query_words), len(track_words))
 
+
+@dataclass(slots=True)
 class TrackMatch:
     """Represents a match between a library track and a Tidal track."""
-    
-    def __init__(
-        self,
-        library_track: LibraryTrack,
-        tidal_track: Optional[Track] = None,
-        musicbrainz_recording: Optional[MusicBrainzRecording] = None,
-        match_confidence: float = 0.0,
-        match_method: str = "unknown"
-    ):
-        self.library_track = library_track
-        self.tidal_track = tidal_track
-        self.musicbrainz_recording = musicbrainz_recording
-        self.match_confidence = match_confidence
-        self.match_method = match_method  # "isrc", "musicbrainz", "metadata"
-        self.skip = False
-        self.skip_reason = ""
+    library_track: LibraryTrack
+    tidal_track: Optional[Track] = None
+    musicbrainz_recording: Optional[MusicBrainzRecording] = None
+    match_confidence: float = 0.0
+    match_method: str = "unknown"  # "isrc", "musicbrainz", "metadata"
+    skip: bool = False
+    skip_reason: str = ""
     
     @property
     def is_matched(self) -> bool:
@@ -59,6 +109,27 @@ class TrackMatch:
         return True
 
 
+@dataclass
+class MatchIndex:
+    """Match results in library order, indexed by Tidal track ID."""
+    matches: List[TrackMatch] = field(default_factory=list)
+    by_tidal_id: Dict[str, TrackMatch] = field(default_factory=dict)
+    
+    def add(self, match: TrackMatch) -> None:
+        """Add a match, indexing it if a Tidal track was found."""
+        self.matches.append(match)
+        if match.tidal_track:
+            self.by_tidal_id[match.tidal_track.id] = match
+    
+    def pending_upgrades(self) -> "MatchIndex":
+        """Get the matches that need an upgrade and were not skipped."""
+        pending = MatchIndex()
+        for match in self.matches:
+            if match.needs_upgrade and not match.skip:
+                pending.add(match)
+        return pending
+
+
 class LibraryUpgradeHandler:
     """
     Handler for library upgrade operations.
@@ -67,6 +138,11 @@ class LibraryUpgradeHandler:
     tracks from an existing music library.
     """
     
+    # Minimum seconds between progress display refreshes while matching
+    UI_REFRESH_INTERVAL = 0.1
+    # Scores at which a candidate is accepted without scoring the rest
+    MB_EARLY_ACCEPT_SCORE = 0.9
+    
     def __init__(
         self,
         client: TidalClient,
@@ -83,8 +159,22 @@ class LibraryUpgradeHandler:
         self.progress_manager = progress_manager
         self.logger = get_logger(__name__)
         
-        self.scanner = LibraryScanner()
-        self.musicbrainz_client = MusicBrainzClient()
+        self.scanner = LibraryScanner(cache_path=get_cache_dir() / "library_scan.sqlite")
+        # MusicBrainz data is stable, so responses are cached for longer than Tidal searches
+        mb_cache = None
+        if settings.response_cache_enabled:
+            mb_cache = ResponseCache(
+                get_cache_dir() / "musicbrainz.sqlite",
+                expire_after=MUSICBRAINZ_CACHE_DAYS * 86400
+            )
+        self.musicbrainz_client = MusicBrainzClient(cache=mb_cache)
+        
+        # Bound concurrent track matching (MusicBrainz is rate limited by its client)
+        self._match_sem = asyncio.Semaphore(self.settings.match_concurrency or 8)
+        # Search results per (lowercased query, min_score), reset for each matching run
+        self._tidal_query_cache: Dict[Tuple[str, float], Optional[Track]] = {}
+        # Tidal tracks resolved up front by batched ISRC lookups
+        self._isrc_matches: Dict[str, Track] = {}
     
     async def handle_library_upgrade(self) -> None:
         """Main entry point for library upgrade functionality."""
@@ -114,8 +204,13 @@ class LibraryUpgradeHandler:
         print(f"\nScanning library: {library_path}")
         self.progress_manager.start_display("Scanning library...")
         
+        tracks: List[LibraryTrack] = []
         try:
-            tracks = await self.scanner.scan_directory(library_path)
+            async for track in self.scanner.scan_directory(library_path):
+                tracks.append(track)
+                self.progress_manager.set_overall_progress_description(
+                    f"Scanned {len(tracks)} files: {track.display_name}"
+                )
         finally:
             self.progress_manager.stop_display()
         
@@ -124,7 +219,7 @@ class LibraryUpgradeHandler:
             return
         
         # Show statistics
-        stats = self.scanner.get_statistics(tracks)
+        stats = self.scanner.get_statistics()
         print(f"\nLibrary Statistics:")
         print(f"  Total tracks: {stats['total_tracks']}")
         print(f"  Total albums: {stats['total_albums']}")
@@ -136,10 +231,15 @@ class LibraryUpgradeHandler:
         if not await get_yes_no("\nProceed with track identification?", True):
             return
         
-        try:
+        async with AsyncExitStack() as stack:
+            # Ensure all client sessions are closed, however matching or downloading ends
+            stack.push_async_callback(self.client.close)
+            stack.push_async_callback(self.musicbrainz_client.close)
+            
             # Match tracks
             print("\nIdentifying tracks...")
-            matches = await self._match_tracks(tracks)
+            match_index = await self._match_tracks(tracks)
+            matches = match_index.matches
             
             # Show match results
             matched_count = sum(1 for m in matches if m.is_matched)
@@ -158,36 +258,24 @@ class LibraryUpgradeHandler:
                 await self._review_matches(matches)
             
             # Filter to tracks that need upgrade
-            tracks_to_upgrade = [m for m in matches if m.needs_upgrade and not m.skip]
+            tracks_to_upgrade = match_index.pending_upgrades()
             
-            if not tracks_to_upgrade:
+            if not tracks_to_upgrade.matches:
                 print("\nNo tracks selected for upgrade.")
                 return
             
-            print(f"\nReady to upgrade {len(tracks_to_upgrade)} tracks.")
+            print(f"\nReady to upgrade {len(tracks_to_upgrade.matches)} tracks.")
             
             # Ask about file handling
             replace_files = await get_yes_no("Replace original files? (No = keep both)", False)
             
-            if not await get_yes_no(f"Download {len(tracks_to_upgrade)} tracks?", True):
+            if not await get_yes_no(f"Download {len(tracks_to_upgrade.matches)} tracks?", True):
                 return
             
             # Download tracks
             await self._download_upgrades(tracks_to_upgrade, replace_files)
-        finally:
-            # Ensure all client sessions are closed
-            if self.musicbrainz_client.session:
-                self.logger.debug("Closing MusicBrainz client session")
-                await self.musicbrainz_client.session.close()
-                self.musicbrainz_client.session = None
-            
-            # Also close the Tidal client session if it exists
-            if self.client.session:
-                self.logger.debug("Closing Tidal client session")
-                await self.client.session.close()
-                self.client.session = None
     
-    async def _match_tracks(self, tracks: List[LibraryTrack]) -> List[TrackMatch]:
+    async def _match_tracks(self, tracks: List[LibraryTrack]) -> MatchIndex:
         """
         Match library tracks to Tidal tracks.
         
@@ -195,9 +283,11 @@ class LibraryUpgradeHandler:
             tracks: List of library tracks
             
         Returns:
-            List of TrackMatch objects
+            MatchIndex with one TrackMatch per library track, in library order
         """
-        matches = []
+        matches: List[Optional[TrackMatch]] = [None] * len(tracks)
+        by_tidal_id: Dict[str, TrackMatch] = {}
+        self._tidal_query_cache.clear()
         
         self.progress_manager.start_display("Matching tracks...")
         self.progress_manager.set_batch_totals(len(tracks))
@@ -205,26 +295,57 @@ class LibraryUpgradeHandler:
         # Initialize the MusicBrainz client session
         if self.musicbrainz_client.session is None:
             self.musicbrainz_client.session = self.musicbrainz_client._get_session()
-            
-        for i, track in enumerate(tracks):
-            self.progress_manager.set_overall_progress_description(
-                f"Matching track {i+1}/{len(tracks)}: {track.display_name}"
-            )
-            
-            match = await self._match_single_track(track)
-            matches.append(match)
-            
-            # Update progress
-            if self.progress_manager.overall_task_id:
-                self.progress_manager.overall_progress_display.update(
-                    self.progress_manager.overall_task_id,
-                    completed=i + 1
-                )
-                if self.progress_manager.live:
-                    self.progress_manager.live.refresh()
         
-        self.progress_manager.stop_display()
-        return matches
+        # Resolve all known ISRCs in batched requests before per-track matching
+        isrcs = [track.isrc for track in tracks if track.isrc]
+        self._isrc_matches = {}
+        if isrcs:
+            self.progress_manager.set_overall_progress_description(f"Looking up {len(isrcs)} ISRCs...")
+            try:
+                self._isrc_matches = await self.client.search_tracks_by_isrcs(isrcs)
+            except Exception as e:
+                self.logger.error(f"Batched ISRC lookup failed: {e}")
+        
+        async def match_at(index: int, track: LibraryTrack) -> Tuple[int, TrackMatch]:
+            async with self._match_sem:
+                try:
+                    return index, await self._match_single_track(track)
+                except Exception as e:
+                    self.logger.error(f"Error matching {track.display_name}: {e}", exc_info=True)
+                    return index, TrackMatch(library_track=track)
+        
+        last_refresh = 0.0
+        try:
+            # The task group cancels outstanding matches if matching is interrupted
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(match_at(i, track)) for i, track in enumerate(tracks)]
+                for done, fut in enumerate(asyncio.as_completed(tasks), start=1):
+                    index, match = await fut
+                    matches[index] = match
+                    if match.tidal_track:
+                        by_tidal_id[match.tidal_track.id] = match
+                    
+                    # Limit UI updates to ~10 per second; always show the final state
+                    now = time.monotonic()
+                    if done < len(tracks) and now - last_refresh < self.UI_REFRESH_INTERVAL:
+                        continue
+                    last_refresh = now
+                    
+                    self.progress_manager.set_overall_progress_description(
+                        f"Matched track {done}/{len(tracks)}: {match.library_track.display_name}"
+                    )
+                    
+                    # Update progress
+                    if self.progress_manager.overall_task_id:
+                        self.progress_manager.overall_progress_display.update(
+                            self.progress_manager.overall_task_id,
+                            completed=done
+                        )
+                        self.progress_manager.refresh()
+        finally:
+            self.progress_manager.stop_display()
+        
+        return MatchIndex(matches=matches, by_tidal_id=by_tidal_id)
     
     async def _match_single_track(self, track: LibraryTrack) -> TrackMatch:
         """
@@ -239,7 +360,9 @@ class LibraryUpgradeHandler:
         # Try ISRC first if available
         if track.isrc:
             self.logger.info(f"Trying ISRC match for {track.display_name}: {track.isrc}")
-            tidal_track = await self._search_tidal_by_isrc(track.isrc)
+            tidal_track = self._isrc_matches.get(track.isrc.upper())
+            if not tidal_track:
+                tidal_track = await self._search_tidal_by_isrc(track.isrc)
             if tidal_track:
                 return TrackMatch(
                     library_track=track,
@@ -261,8 +384,8 @@ class LibraryUpgradeHandler:
             )
             
             if mb_recordings:
-                # Score and sort recordings
-                scored_recordings = []
+                # Find the best recording, stopping early on a near-certain match
+                best_score, best_recording = -1.0, None
                 for recording in mb_recordings:
                     score = self.musicbrainz_client.calculate_match_score(
                         recording,
@@ -271,12 +394,10 @@ class LibraryUpgradeHandler:
                         album=track.album,
                         duration=track.duration_ms
                     )
-                    scored_recordings.append((score, recording))
-                
-                scored_recordings.sort(key=lambda x: x[0], reverse=True)
-                
-                # Try the best match
-                best_score, best_recording = scored_recordings[0]
+                    if score > best_score:
+                        best_score, best_recording = score, recording
+                        if score >= self.MB_EARLY_ACCEPT_SCORE:
+                            break
                 
                 if best_score >= 0.7:  # Good enough match
                     # Debug log the artist names
@@ -338,15 +459,11 @@ class LibraryUpgradeHandler:
             if search_results and search_results.tracks:
                 tracks = search_results.tracks.get('items', [])
                 
-                # Look for exact ISRC match
-                for track_data in tracks:
-                    track = self.client._parse_model(track_data, Track)
-                    if track.isrc == isrc:
-                        return track
-                
-                # If no exact match, return first result
-                if tracks:
-                    return self.client._parse_model(tracks[0], Track)
+                # Look for exact ISRC match (first occurrence wins), else take the first result
+                isrc_map = {track_data.get('isrc'): track_data for track_data in reversed(tracks)}
+                hit = isrc_map.get(isrc) or (tracks[0] if tracks else None)
+                if hit:
+                    return self.client._parse_model(hit, Track)
             
         except Exception as e:
             self.logger.error(f"Error searching Tidal by ISRC {isrc}: {str(e)}")
@@ -359,75 +476,138 @@ class LibraryUpgradeHandler:
         title: str,
         album: Optional[str] = None
     ) -> Optional[Track]:
-        """Search Tidal for a track by metadata using multiple strategies."""
-        # Define search strategies in order of preference
-        search_strategies = [
+        """
+        Search Tidal for a track by metadata using multiple strategies.
+        
+        Strategies run in tiers of decreasing precision. The searches within
+        a tier run concurrently and the first match wins; the rest are cancelled.
+        """
+        strategies = enumerate(self._metadata_search_queries(artist, title, album), start=1)
+        for tier, group in groupby(strategies, key=lambda item: item[1][0]):
+            tasks = {
+                asyncio.create_task(self._try_search(query, min_score=min_score)): number
+                for number, (_, query, min_score) in group
+            }
+            self.logger.debug(f"Trying search tier {tier}: strategies {sorted(tasks.values())}")
+            result = await self._first_search_result(tasks)
+            if result:
+                return result
+        
+        self.logger.info(f"No matches found for {artist} - {title} after trying all search strategies")
+        return None
+    
+    async def _first_search_result(self, tasks: Dict[asyncio.Task, int]) -> Optional[Track]:
+        """
+        Wait for the first search task that finds a track and cancel the others.
+        
+        Args:
+            tasks: Search tasks mapped to their strategy number
+            
+        Returns:
+            The first track found, or None if no task found one
+        """
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Prefer the more precise strategy when several finish together
+                for task in sorted(done, key=tasks.get):
+                    result = task.result()
+                    if result:
+                        self.logger.info(f"Found match using strategy #{tasks[task]}")
+                        return result
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+    
+    def _metadata_search_queries(
+        self,
+        artist: str,
+        title: str,
+        album: Optional[str] = None
+    ) -> Iterator[Tuple[int, str, float]]:
+        """
+        Yield (tier, query, min_score) search strategies in order of preference,
+        skipping strategies that produce a query already tried.
+        """
+        def strategies() -> Iterator[Tuple[int, str, float]]:
             # Strategy 1: Artist + Title + Album (original strategy)
-            lambda: self._try_search(f'{artist} {title} {album}' if album else f'{artist} {title}'),
+            yield 1, (f'{artist} {title} {album}' if album else f'{artist} {title}'), 0.2
             
             # Strategy 2: Artist + Title (without album)
-            lambda: self._try_search(f'{artist} {title}'),
+            yield 1, f'{artist} {title}', 0.2
             
             # Strategy 3: "Artist - Title" format
-            lambda: self._try_search(f'{artist} - {title}'),
+            yield 1, f'{artist} - {title}', 0.2
             
             # Strategy 4: Title only (for very distinctive titles)
-            lambda: self._try_search(title, min_score=0.5),  # Higher threshold for title-only
+            yield 2, title, 0.5  # Higher threshold for title-only
             
             # Strategy 5: Artist + partial title (first few words)
-            lambda: self._try_search(f'{artist} {" ".join(title.split()[:2])}'),
+            yield 2, f'{artist} {" ".join(title.split()[:2])}', 0.2
             
             # Strategy 6: Quoted exact search
-            lambda: self._try_search(f'"{artist}" "{title}"'),
+            yield 2, f'"{artist}" "{title}"', 0.2
             
             # Strategy 7: Artist in quotes, title without quotes
-            lambda: self._try_search(f'"{artist}" {title}'),
+            yield 2, f'"{artist}" {title}', 0.2
             
             # Strategy 8: Title in quotes, artist without quotes
-            lambda: self._try_search(f'{artist} "{title}"'),
+            yield 2, f'{artist} "{title}"', 0.2
             
             # Strategy 9: Remove special characters from title
-            lambda: self._try_search(f'{artist} {self._clean_title(title)}'),
+            yield 3, f'{artist} {self._clean_title(title)}', 0.2
             
             # Strategy 10: Album + Title (for tracks with common names)
-            lambda: self._try_search(f'{album} {title}', min_score=0.4) if album else None,
+            if album:
+                yield 3, f'{album} {title}', 0.4
             
             # Strategy 11: Just the first word of the title with artist (for titles with subtitles)
-            lambda: self._try_search(f'{artist} {title.split()[0]}', min_score=0.3) if len(title.split()) > 1 else None,
+            if len(title.split()) > 1:
+                yield 3, f'{artist} {title.split()[0]}', 0.3
             
             # Strategy 12: Last resort - very low threshold with artist name
-            lambda: self._try_search(f'{artist}', min_score=0.15)
-        ]
+            yield 3, f'{artist}', 0.15
         
-        # Try each strategy until we find a match
-        for strategy_index, strategy in enumerate(search_strategies):
-            self.logger.debug(f"Trying search strategy #{strategy_index + 1}")
-            result = await strategy()
-            if result:
-                self.logger.info(f"Found match using strategy #{strategy_index + 1}")
-                return result
-        
-        self.logger.info(f"No matches found for {artist} - {title} after trying all search strategies")
-        return None
+        seen = set()
+        for tier, query, min_score in strategies():
+            key = (query.lower(), min_score)
+            if key in seen:
+                continue
+            seen.add(key)
+            yield tier, query, min_score
     
     def _clean_title(self, title: str) -> str:
         """Remove special characters and parentheses from title."""
         # Remove content in parentheses, brackets, etc.
-        import re
-        cleaned = re.sub(r'\([^)]*\)', '', title)
-        cleaned = re.sub(r'\[[^\]]*\]', '', cleaned)
-        cleaned = re.sub(r'\{[^}]*\}', '', cleaned)
+        cleaned = _PAREN_RE.sub('', title)
+        cleaned = _BRACKET_RE.sub('', cleaned)
+        cleaned = _BRACE_RE.sub('', cleaned)
         
         # Remove special characters
-        cleaned = re.sub(r'[^\w\s]', '', cleaned)
+        cleaned = _NONWORD_RE.sub('', cleaned)
         
         # Remove extra whitespace
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+        cleaned = _WS_RE.sub(' ', cleaned).strip()
         
         return cleaned
     
     async def _try_search(self, query: str, min_score: float = 0.2) -> Optional[Track]:
-        """Try a single search query and score the results."""
+        """Try a single search query and score the results (cached per query and threshold)."""
+        cache_key = (query.lower(), min_score)
+        if cache_key in self._tidal_query_cache:
+            self.logger.debug(f"Using cached search result for query: {query}")
+            return self._tidal_query_cache[cache_key]
+        
+        result = await self._run_search(query, min_score)
+        self._tidal_query_cache[cache_key] = result
+        return result
+    
+    async def _run_search(self, query: str, min_score: float) -> Optional[Track]:
+        """Run a single search query against Tidal and score the results."""
         try:
             self.logger.debug(f"Searching Tidal with query: {query}")
             
@@ -450,40 +630,42 @@ class LibraryUpgradeHandler:
                 query_artist = query_parts[0] if query_parts else ""
                 query_title = query_parts[-1] if len(query_parts) > 1 else ""
                 
-                # Score tracks
-                scored_tracks = []
+                # These are constant across all results
+                q_artist_lc = query_artist.lower()
+                q_title_lc = query_title.lower()
+                
+                # Score the raw result dicts; only the winner is parsed into a Track
+                best_score, best_data, best_details = -1.0, None, []
                 
-                for track_data in tracks:
-                    track = self.client._parse_model(track_data, Track)
+                for position, track_data in enumerate(tracks):
+                    artist_names_lc = [a.lower() for a in _raw_artist_names(track_data)]
+                    track_title_lc = (track_data.get('title') or '').lower()
                     
                     # Calculate similarity score
                     score = 0.0
                     score_details = []
                     
                     # Artist match (more weight for exact match)
-                    if any(a.lower() == query_artist.lower() for a in track.artist_names.split(', ')):
+                    exact_artist = q_artist_lc in artist_names_lc
+                    if exact_artist:
                         score += 0.4
                         score_details.append(f"Artist exact match: +0.4")
-                    elif any(query_artist.lower() in a.lower() for a in track.artist_names.split(', ')):
+                    elif any(q_artist_lc in a for a in artist_names_lc):
                         score += 0.2
                         score_details.append(f"Artist partial match: +0.2")
-                    elif any(a.lower() in query_artist.lower() for a in track.artist_names.split(', ')):
+                    elif any(a in q_artist_lc for a in artist_names_lc):
                         score += 0.1
                         score_details.append(f"Artist reverse partial match: +0.1")
                     
                     # Title match with word-by-word comparison for better fuzzy matching
-                    query_title_words = set(w.lower() for w in query_title.split())
-                    track_title_words = set(w.lower() for w in track.title.split())
-                    
-                    # Calculate word overlap
-                    common_words = query_title_words.intersection(track_title_words)
-                    if common_words:
-                        word_match_score = len(common_words) / max(len(query_title_words), len(track_title_words))
-                        score += word_match_score * 0.4  # Scale by max title score
-                        score_details.append(f"Title word match ({len(common_words)}/{max(len(query_title_words), len(track_title_words))}): +{word_match_score * 0.4:.2f}")
+                    similarity = _title_similarity(q_title_lc, track_title_lc, RAPIDFUZZ_AVAILABLE)
+                    if similarity:
+                        score += similarity * 0.4  # Scale by max title score
+                        score_details.append(f"Title similarity ({similarity:.2f}): +{similarity * 0.4:.2f}")
                     
                     # Exact title match bonus
-                    if track.title.lower() == query_title.lower():
+                    exact_title = track_title_lc == q_title_lc
+                    if exact_title:
                         score += 0.2
                         score_details.append(f"Title exact match bonus: +0.2")
                     
@@ -493,32 +675,30 @@ class LibraryUpgradeHandler:
                         score_details.append(f"High confidence bonus: +0.1")
                     
                     # Add bonus for first result (Tidal's relevance ranking)
-                    if len(scored_tracks) == 0:
+                    if position == 0:
                         score += 0.05
                         score_details.append(f"First result bonus: +0.05")
                     
-                    scored_tracks.append((score, track, score_details))
+                    if score > best_score:
+                        best_score, best_data, best_details = score, track_data, score_details
+                    
+                    # An exact artist and title match scores at least as high as any later result can
+                    if exact_artist and exact_title:
+                        break
                 
-                # Sort by score (highest first)
-                scored_tracks.sort(key=lambda x: x[0], reverse=True)
+                # Log the best scored track for debugging
+                album_title = (best_data.get('album') or {}).get('title') or 'Unknown'
+                self.logger.debug(f"Best match: {', '.join(_raw_artist_names(best_data))} - {best_data.get('title')} (Album: {album_title})")
+                self.logger.debug(f"  Score: {best_score:.2f} - {', '.join(best_details)}")
                 
-                # Log all scored tracks for debugging
-                for i, (score, track, details) in enumerate(scored_tracks[:3]):  # Log top 3 matches
-                    self.logger.debug(f"Match #{i+1}: {track.artist_names} - {track.title} (Album: {track.album.title if track.album else 'Unknown'})")
-                    self.logger.debug(f"  Score: {score:.2f} - {', '.join(details)}")
+                best_track = self.client._parse_model(best_data, Track)
                 
-                # Get best match
-                if scored_tracks:
-                    best_score, best_track, _ = scored_tracks[0]
-                    
-                    # Use provided minimum score threshold
-                    if best_score >= min_score:
-                        self.logger.info(f"Found match with score {best_score:.2f}: {best_track.artist_names} - {best_track.title}")
-                        return best_track
-                    else:
-                        self.logger.info(f"Best match score {best_score:.2f} below threshold ({min_score}): {best_track.artist_names} - {best_track.title}")
+                # Use provided minimum score threshold
+                if best_score >= min_score:
+                    self.logger.info(f"Found match with score {best_score:.2f}: {best_track.artist_names} - {best_track.title}")
+                    return best_track
                 else:
-                    self.logger.info("No tracks found in search results")
+                    self.logger.info(f"Best match score {best_score:.2f} below threshold ({min_score}): {best_track.artist_names} - {best_track.title}")
             else:
                 self.logger.info("No search results returned from Tidal")
             
@@ -571,20 +751,15 @@ class LibraryUpgradeHandler:
     
     async def _download_upgrades(
         self,
-        matches: List[TrackMatch],
+        match_index: MatchIndex,
         replace_files: bool
     ) -> None:
         """Download upgraded versions of tracks."""
-        print(f"\nDownloading {len(matches)} tracks...")
-        
-        # Convert matches to Tidal tracks
-        tracks_to_download = []
-        track_to_match_map = {}
+        print(f"\nDownloading {len(match_index.matches)} tracks...")
         
-        for match in matches:
-            if match.tidal_track:
-                tracks_to_download.append(match.tidal_track)
-                track_to_match_map[match.tidal_track.id] = match
+        # Pending upgrades always have a Tidal track
+        tracks_to_download = [match.tidal_track for match in match_index.matches]
+        track_to_match_map = match_index.by_tidal_id
         
         # Download tracks
         results = await self.batch_downloader.download_tracks(tracks_to_download)
@@ -592,30 +767,34 @@ class LibraryUpgradeHandler:
         # Process results
         success_count = 0
         failed_count = 0
+        backups: List[Tuple[Path, Path]] = []
         
         for result in results:
             if result.success and not result.skipped:
                 success_count += 1
                 
-                # Handle file replacement if requested
+                # Collect files to replace if requested
                 if replace_files and result.track and result.track.id in track_to_match_map:
-                    match = track_to_match_map[result.track.id]
-                    old_file = match.library_track.file_path
+                    old_file = track_to_match_map[result.track.id].library_track.file_path
+                    # Create backup with .old extension
+                    backups.append((old_file, old_file.with_suffix(old_file.suffix + '.old')))
                     
-                    try:
-                        # Create backup with .old extension
-                        backup_path = old_file.with_suffix(old_file.suffix + '.old')
-                        old_file.rename(backup_path)
-                        self.logger.info(f"Backed up original file to: {backup_path}")
-                        
-                        # TODO: Move new file to original location
-                        # This would require modifying the download path logic
-                        
-                    except Exception as e:
-                        self.logger.error(f"Error handling file replacement: {str(e)}")
+                    # TODO: Move new file to original location
+                    # This would require modifying the download path logic
             else:
                 failed_count += 1
         
+        # Rename originals off the event loop, concurrently
+        backup_results = await asyncio.gather(
+            *(asyncio.to_thread(old_file.rename, backup_path) for old_file, backup_path in backups),
+            return_exceptions=True
+        )
+        for (old_file, backup_path), outcome in zip(backups, backup_results):
+            if isinstance(outcome, Exception):
+                self.logger.error(f"Error handling file replacement: {str(outcome)}")
+            else:
+                self.logger.info(f"Backed up original file to: {backup_path}")
+        
         print(f"\nUpgrade complete!")
         print(f"  Successfully upgraded: {success_count}")
         print(f"  Failed: {failed_count}")
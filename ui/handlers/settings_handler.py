@@ -1,17 +1,30 @@
 """
 Handles settings-related actions for the CLI.
 """
-from typing import TYPE_CHECKING, Any # Import Any
+import sys
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Tuple # Import Any
 from pathlib import Path
 
 from riptidal.core.settings import Settings, AudioQuality, VideoQuality, save_settings
 from riptidal.ui.input_utils import get_input, get_choice, get_yes_no
-from riptidal.api.client import TidalClient # Needed for re-init
-from riptidal.api.auth import AuthManager # Needed for re-init
-from riptidal.core.downloader import BatchDownloader # Needed for re-init
+
+if TYPE_CHECKING:
+    from riptidal.api.auth import AuthManager
+    from riptidal.api.client import TidalClient
+    from riptidal.core.downloader import BatchDownloader
+
+# Quality options in menu order and their labels
+_AUDIO_QUALITIES = list(AudioQuality)
+_AUDIO_LABELS = {i: q.name for i, q in enumerate(AudioQuality)}
+_VIDEO_QUALITIES = list(VideoQuality)
+_VIDEO_LABELS = {i: q.name for i, q in enumerate(VideoQuality)}
 
 
 class SettingsHandler:
+    _HEADER = "\n=== Settings ==="
+    _BACK_LINE = "0. Back"
+    _FOOTER = "================\n"
+    
     def __init__(self, settings: Settings, progress_manager: 'RichProgressManager', cli_instance: Any):
         """
         Initialize the SettingsHandler.
@@ -23,40 +36,84 @@ class SettingsHandler:
         self.settings = settings
         self.progress_manager = progress_manager
         self.cli_instance = cli_instance # To re-initialize client, auth, downloader on API key change
+        self._dirty = False # Unsaved changes, written once on menu exit
+        # (client, auth_manager, batch_downloader) built per API key index, reused on re-selection
+        self._client_cache: Dict[int, Tuple['TidalClient', 'AuthManager', 'BatchDownloader']] = {}
+        # Settings menu options
+        self._actions: Dict[str, Callable[[], Awaitable[None]]] = {
+            "1": self._set_download_path,
+            "2": self._set_audio_quality,
+            "3": self._set_video_quality,
+            "4": self._set_quality_fallback,
+            "5": self._set_enable_playlists,
+            "6": self._set_download_full_albums,
+            "7": self._set_create_m3u_playlists,
+            "8": self.handle_api_key_selection, # Saved on menu exit
+        }
+
+    def save_if_dirty(self) -> bool:
+        """
+        Save settings if they were changed since the last save.
+        
+        Returns:
+            True if settings were written
+        """
+        if not self._dirty:
+            return False
+        save_settings(self.settings)
+        self._dirty = False
+        return True
+
+    async def close(self) -> None:
+        """Close every cached client other than the one the CLI is currently using."""
+        active = self.cli_instance.client
+        for client, _, _ in self._client_cache.values():
+            if client is not active:
+                await client.close()
+        self._client_cache.clear()
 
     async def _print_settings_menu(self) -> None:
         """Prints the settings menu."""
-        print("\n=== Settings ===")
-        print(f"1. Download Path: {self.settings.download_path}")
-        print(f"2. Audio Quality: {self.settings.audio_quality.name if hasattr(self.settings.audio_quality, 'name') else self.settings.audio_quality}")
-        print(f"3. Video Quality: {self.settings.video_quality.name if hasattr(self.settings.video_quality, 'name') else self.settings.video_quality}")
-        print(f"4. Quality Fallback: {'Enabled' if self.settings.quality_fallback else 'Disabled'}")
-        print(f"5. Enable Playlists: {'Enabled' if self.settings.enable_playlists else 'Disabled'}")
-        print(f"6. Download Full Albums: {'Enabled' if self.settings.download_full_albums else 'Disabled'}")
-        print(f"7. Create M3U Playlists: {'Enabled' if self.settings.create_m3u_playlists else 'Disabled'}")
-        # Max Concurrent Downloads is now hardcoded to 1
-        print(f"8. API Key Selection")
-        print("0. Back")
-        print("================\n")
+        settings = self.settings
+        lines = [
+            self._HEADER,
+            f"1. Download Path: {settings.download_path}",
+            f"2. Audio Quality: {getattr(settings.audio_quality, 'name', settings.audio_quality)}",
+            f"3. Video Quality: {getattr(settings.video_quality, 'name', settings.video_quality)}",
+            f"4. Quality Fallback: {'Enabled' if settings.quality_fallback else 'Disabled'}",
+            f"5. Enable Playlists: {'Enabled' if settings.enable_playlists else 'Disabled'}",
+            f"6. Download Full Albums: {'Enabled' if settings.download_full_albums else 'Disabled'}",
+            f"7. Create M3U Playlists: {'Enabled' if settings.create_m3u_playlists else 'Disabled'}",
+            # Max Concurrent Downloads is now hardcoded to 1
+            "8. API Key Selection",
+            self._BACK_LINE,
+            self._FOOTER,
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     async def handle_api_key_selection(self) -> None:
         """Handle API key selection."""
         from riptidal.api.keys import get_all_keys, get_key # is_key_valid removed as not used
 
-        self.progress_manager.stop_display()
+        if not self.progress_manager.is_stopped:
+            self.progress_manager.stop_display()
         print("\n=== API Key Selection ===")
         
         keys = get_all_keys()
         current_key_details = get_key(self.settings.api_key_index)
         print(f"Current API key: {current_key_details['platform']} - {current_key_details['formats']}")
-        if current_key_details['valid'] != 'True':
+        if not current_key_details['valid_bool']:
             print("WARNING: Current key is marked as invalid. This may cause issues.")
         
-        print("\nAvailable API keys:")
-        for i, key_info in enumerate(keys):
-            valid_str = "Valid" if key_info['valid'] == 'True' else "Invalid"
-            current_str = " (Current)" if i == self.settings.api_key_index else ""
-            print(f"{i}. {key_info['platform']} - {key_info['formats']} - {valid_str}{current_str}")
+        current_index = self.settings.api_key_index
+        lines = ["\nAvailable API keys:"]
+        lines.extend(
+            f"{i}. {key_info['platform']} - {key_info['formats']} - "
+            f"{'Valid' if key_info['valid_bool'] else 'Invalid'}{' (Current)' if i == current_index else ''}"
+            for i, key_info in enumerate(keys)
+        )
+        print("\n".join(lines))
         
         choice_str = await get_input("Enter API key index (or press Enter to cancel)")
         if not choice_str:
@@ -65,29 +122,125 @@ class SettingsHandler:
         try:
             index = int(choice_str)
             if 0 <= index < len(keys):
+                if index == self.settings.api_key_index:
+                    print(f"API key {index} is already selected.")
+                    return
+                
+                # Keep the current stack so switching back to this key is free
+                cli = self.cli_instance
+                if current_key_details['valid_bool']:
+                    self._client_cache[self.settings.api_key_index] = (
+                        cli.client, cli.auth_manager, cli.batch_downloader
+                    )
+                
                 self.settings.api_key_index = index
                 
-                # Reinitialize client, auth_manager, and batch_downloader on the CLI instance
-                self.cli_instance.client = TidalClient(self.settings)
-                self.cli_instance.auth_manager = AuthManager(self.cli_instance.client, self.settings)
-                # Ensure the progress_manager's callback and track_manager are correctly passed
-                self.cli_instance.batch_downloader = BatchDownloader(
-                    self.cli_instance.client, 
-                    self.settings, 
-                    self.cli_instance.progress_manager.update_progress,
-                    self.cli_instance.track_manager  # Pass track_manager to BatchDownloader
-                )
+                cached = self._client_cache.get(index)
+                if cached:
+                    cli.client, cli.auth_manager, cli.batch_downloader = cached
+                    # Pick up any login that happened since this client was built
+                    if self.settings.country_code:
+                        cli.client.login_key.countryCode = self.settings.country_code
+                    if self.settings.auth_token:
+                        cli.client.login_key.accessToken = self.settings.auth_token
+                else:
+                    # Only needed when switching keys, so imported lazily
+                    from riptidal.api.client import TidalClient
+                    from riptidal.api.auth import AuthManager
+                    from riptidal.core.downloader import BatchDownloader
+                    
+                    # Reinitialize client, auth_manager, and batch_downloader on the CLI instance
+                    cli.client = TidalClient(self.settings)
+                    cli.auth_manager = AuthManager(cli.client, self.settings)
+                    # Ensure the progress_manager's callback and track_manager are correctly passed
+                    cli.batch_downloader = BatchDownloader(
+                        cli.client, 
+                        self.settings, 
+                        cli.progress_manager.update_progress,
+                        cli.track_manager  # Pass track_manager to BatchDownloader
+                    )
                 
-                selected_key_details = get_key(index)
+                selected_key_details = keys[index]
                 print(f"API key changed to: {selected_key_details['platform']} - {selected_key_details['formats']}")
-                if selected_key_details['valid'] != 'True':
+                if not selected_key_details['valid_bool']:
                     print("WARNING: Selected key is marked as invalid. This may cause issues.")
-                save_settings(self.settings) # Save settings immediately
+                self._dirty = True
             else:
                 print(f"Please enter a number between 0 and {len(keys) - 1}")
         except ValueError:
             print("Please enter a valid number.")
 
+    async def _set_download_path(self) -> None:
+        """Prompt for a new download path."""
+        path_str = await get_input("Enter download path", str(self.settings.download_path))
+        if path_str:
+            try:
+                new_path = Path(path_str)
+                if new_path != self.settings.download_path:
+                    new_path.mkdir(parents=True, exist_ok=True)
+                    self.settings.download_path = new_path
+                    self._dirty = True
+                print(f"Download path set to: {self.settings.download_path}")
+            except Exception as e:
+                print(f"Error setting download path: {e}")
+
+    async def _set_audio_quality(self) -> None:
+        """Prompt for the audio quality."""
+        print("Available audio qualities:")
+        print("\n".join(f"{i}. {label}" for i, label in _AUDIO_LABELS.items()))
+        
+        quality_idx = await get_choice("Enter audio quality number", _AUDIO_QUALITIES, display_choices=False)
+        if quality_idx in _AUDIO_LABELS:
+            if _AUDIO_QUALITIES[quality_idx] != self.settings.audio_quality:
+                self.settings.audio_quality = _AUDIO_QUALITIES[quality_idx]
+                self._dirty = True
+            print(f"Audio quality set to: {self.settings.audio_quality.name}")
+
+    async def _set_video_quality(self) -> None:
+        """Prompt for the video quality."""
+        print("Available video qualities:")
+        print("\n".join(f"{i}. {label}" for i, label in _VIDEO_LABELS.items()))
+        
+        quality_idx = await get_choice("Enter video quality number", _VIDEO_QUALITIES, display_choices=False)
+        if quality_idx in _VIDEO_LABELS:
+            if _VIDEO_QUALITIES[quality_idx] != self.settings.video_quality:
+                self.settings.video_quality = _VIDEO_QUALITIES[quality_idx]
+                self._dirty = True
+            print(f"Video quality set to: {self.settings.video_quality.name}")
+
+    async def _toggle(self, field: str, prompt: str, label: str) -> None:
+        """
+        Prompt for a boolean setting.
+        
+        Args:
+            field: Name of the Settings field
+            prompt: Yes/no question to ask
+            label: Label used when reporting the new value
+        """
+        value = await get_yes_no(prompt, getattr(self.settings, field))
+        if value != getattr(self.settings, field):
+            setattr(self.settings, field, value)
+            self._dirty = True
+        print(f"{label}: {'Enabled' if value else 'Disabled'}")
+
+    async def _set_quality_fallback(self) -> None:
+        """Toggle quality fallback."""
+        await self._toggle("quality_fallback", "Enable quality fallback?", "Quality fallback")
+
+    async def _set_enable_playlists(self) -> None:
+        """Toggle playlist support."""
+        await self._toggle("enable_playlists", "Enable playlists?", "Playlists")
+
+    async def _set_download_full_albums(self) -> None:
+        """Toggle downloading full albums."""
+        await self._toggle(
+            "download_full_albums", "Download full albums for favorite/playlist tracks?", "Download full albums"
+        )
+
+    async def _set_create_m3u_playlists(self) -> None:
+        """Toggle M3U playlist creation."""
+        await self._toggle("create_m3u_playlists", "Create M3U playlists?", "Create M3U playlists")
+
     async def handle_settings(self) -> bool: # Modified return type hint
         """Handle the settings menu."""
         self.progress_manager.stop_display()
@@ -96,68 +249,13 @@ class SettingsHandler:
             choice = await get_input("Enter your choice")
             
             if not choice or choice == "0":
-                save_settings(self.settings)
-                print("Settings saved.")
+                # Changes are written once, when leaving the menu
+                if self.save_if_dirty():
+                    print("Settings saved.")
                 return True # Return True to signify sub-menu exit, not app exit
             
-            if choice == "1":
-                path_str = await get_input("Enter download path", str(self.settings.download_path))
-                if path_str:
-                    try:
-                        self.settings.download_path = Path(path_str)
-                        self.settings.download_path.mkdir(parents=True, exist_ok=True)
-                        print(f"Download path set to: {self.settings.download_path}")
-                        save_settings(self.settings) # Save settings immediately
-                    except Exception as e:
-                        print(f"Error setting download path: {e}")
-            elif choice == "2":
-                print("Available audio qualities:")
-                qualities = list(AudioQuality)
-                for i, quality in enumerate(qualities):
-                    print(f"{i}. {quality.name}")
-                
-                quality_idx = await get_choice("Enter audio quality number", qualities, display_choices=False)
-                if quality_idx != -1 and 0 <= quality_idx < len(qualities):
-                    self.settings.audio_quality = qualities[quality_idx]
-                    print(f"Audio quality set to: {self.settings.audio_quality.name}")
-                    save_settings(self.settings) # Save settings immediately
-            elif choice == "3":
-                print("Available video qualities:")
-                qualities = list(VideoQuality)
-                for i, quality in enumerate(qualities):
-                    print(f"{i}. {quality.name}")
-                
-                quality_idx = await get_choice("Enter video quality number", qualities, display_choices=False)
-                if quality_idx != -1 and 0 <= quality_idx < len(qualities):
-                    self.settings.video_quality = qualities[quality_idx]
-                    print(f"Video quality set to: {self.settings.video_quality.name}")
-                    save_settings(self.settings) # Save settings immediately
-            elif choice == "4":
-                self.settings.quality_fallback = await get_yes_no(
-                    "Enable quality fallback?", self.settings.quality_fallback
-                )
-                print(f"Quality fallback: {'Enabled' if self.settings.quality_fallback else 'Disabled'}")
-                save_settings(self.settings) # Save settings immediately
-            elif choice == "5":
-                self.settings.enable_playlists = await get_yes_no(
-                    "Enable playlists?", self.settings.enable_playlists
-                )
-                print(f"Playlists: {'Enabled' if self.settings.enable_playlists else 'Disabled'}")
-                save_settings(self.settings) # Save settings immediately
-            elif choice == "6":
-                self.settings.download_full_albums = await get_yes_no(
-                    "Download full albums for favorite/playlist tracks?", self.settings.download_full_albums
-                )
-                print(f"Download full albums: {'Enabled' if self.settings.download_full_albums else 'Disabled'}")
-                save_settings(self.settings) # Save settings immediately
-            elif choice == "7":
-                self.settings.create_m3u_playlists = await get_yes_no(
-                    "Create M3U playlists?", self.settings.create_m3u_playlists
-                )
-                print(f"Create M3U playlists: {'Enabled' if self.settings.create_m3u_playlists else 'Disabled'}")
-                save_settings(self.settings) # Save settings immediately
-            # Option 8 is now API Key Selection
-            elif choice == "8":
-                await self.handle_api_key_selection() # handle_api_key_selection now saves settings
+            handler = self._actions.get(choice)
+            if handler:
+                await handler()
             else:
                 print("Invalid choice.")
@@ -1,7 +1,61 @@
 """
 Utility functions for handling user input in the CLI.
 """
-from typing import List, Optional, Any
+import asyncio
+import sys
+import threading
+from typing import Any, Dict, List, Optional
+
+
+# Accepted answers for get_yes_no
+_YES = frozenset({"y", "yes"})
+_NO = frozenset({"n", "no"})
+
+# Label attribute ('label', 'name' or None for str()) per choice type, probed once per type
+_LABEL_ATTRS: Dict[type, Optional[str]] = {}
+
+
+def _choice_label(choice_item: Any) -> str:
+    """Get the display label for a choice item."""
+    item_type = type(choice_item)
+    if item_type not in _LABEL_ATTRS:
+        _LABEL_ATTRS[item_type] = next(
+            (attr for attr in ('label', 'name') if hasattr(choice_item, attr)), None
+        )
+    attr = _LABEL_ATTRS[item_type]
+    return getattr(choice_item, attr) if attr else str(choice_item)
+
+async def _readline() -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+    
+    A daemon thread is used rather than the default executor so that a
+    pending read never holds up interpreter shutdown (e.g. after Ctrl+C).
+    
+    Returns:
+        The line read, including its newline, or "" at end of input
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def deliver(line: Optional[str], error: Optional[BaseException]) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(line)
+    
+    def worker() -> None:
+        try:
+            line = sys.stdin.readline()
+        except Exception as e:
+            loop.call_soon_threadsafe(deliver, None, e)
+        else:
+            loop.call_soon_threadsafe(deliver, line, None)
+    
+    threading.Thread(target=worker, name="stdin-reader", daemon=True).start()
+    return await future
 
 async def get_input(prompt: str, default: Optional[str] = None) -> str:
     """
@@ -20,7 +74,13 @@ async def get_input(prompt: str, default: Optional[str] = None) -> str:
         prompt_display = f"{prompt}: "
     
     try:
-        value = input(prompt_display)
+        sys.stdout.write(prompt_display)
+        sys.stdout.flush()
+        line = await _readline()
+        if not line:
+            # End of input, like input() raising EOFError
+            raise EOFError
+        value = line.rstrip("\r\n")
         if not value and default:
             return default
         return value
@@ -41,17 +101,19 @@ async def get_choice(prompt: str, choices: List[Any], display_choices: bool = Tr
     Returns:
         Index of the chosen item, or -1 if cancelled or invalid.
     """
+    by_label: Optional[Dict[str, int]] = None
+    base = 1 if display_choices else 0
+    
     if display_choices:
         print("Available options:")
         for i, choice_item in enumerate(choices):
-            label = getattr(choice_item, 'label', getattr(choice_item, 'name', str(choice_item)))
-            print(f"{i+1}. {label}")
+            print(f"{i+1}. {_choice_label(choice_item)}")
     
     # Prepare prompt with default if provided
     display_prompt = prompt
     if default is not None:
         # For display, convert 0-based index to 1-based
-        display_default = default + 1 if display_choices else default
+        display_default = default + base
         display_prompt = f"{prompt} [{display_default}]"
     
     while True:
@@ -61,16 +123,24 @@ async def get_choice(prompt: str, choices: List[Any], display_choices: bool = Tr
                 # Return default if provided, otherwise -1
                 return default if default is not None else -1
             
-            value_int = int(value_str)
+            try:
+                value_int = int(value_str)
+            except ValueError:
+                # Allow choosing by label, e.g. "hifi"
+                if by_label is None:
+                    by_label = {_choice_label(c).lower(): i for i, c in enumerate(choices)}
+                if value_str.strip().lower() in by_label:
+                    return by_label[value_str.strip().lower()]
+                raise
             
-            if 0 <= value_int < len(choices): # Assumes 0-indexed input if not displayed 1-based
-                 return value_int
-            elif 1 <= value_int <= len(choices): # Assumes 1-indexed input if displayed
-                 return value_int -1
+            # Displayed choices are numbered from 1, otherwise input is 0-based
+            idx = value_int - base
+            if 0 <= idx < len(choices):
+                return idx
 
-            print(f"Please enter a number between {1 if display_choices else 0} and {len(choices) if display_choices else len(choices)-1}.")
+            print(f"Please enter a number between {base} and {len(choices) - 1 + base}.")
         except ValueError:
-            print("Please enter a valid number.")
+            print("Please enter a valid number or option name.")
         except (KeyboardInterrupt, EOFError):
             print("\nOperation cancelled during choice.")
             return -1
@@ -89,10 +159,11 @@ async def get_yes_no(prompt: str, default: bool = False) -> bool:
     default_str = "Y" if default else "N"
     while True:
         value = await get_input(f"{prompt} (Y/N)", default_str)
-        if value.lower() in ["y", "yes"]:
+        if value == "":
+            return default
+        answer = value.lower()
+        if answer in _YES:
             return True
-        elif value.lower() in ["n", "no"]:
+        elif answer in _NO:
             return False
-        if value == "": 
-            return default
         print("Please enter Y or N.")
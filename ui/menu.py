@@ -4,12 +4,13 @@ Menu system for RIPTIDAL.
 This module provides a menu system for the application.
 """
 
-from typing import List, Dict, Any, Optional, Callable, Awaitable, TypeVar, Generic, Union
+import sys
+from typing import List, Dict, Any, Optional, Callable, Awaitable, Union
 
-T = TypeVar('T')
+from riptidal.ui.input_utils import get_input
 
 
-class MenuItem(Generic[T]):
+class MenuItem:
     """
     Menu item class.
     
@@ -19,7 +20,7 @@ class MenuItem(Generic[T]):
     def __init__(
         self,
         label: str,
-        action: Optional[Callable[..., Awaitable[T]]] = None,
+        action: Optional[Callable[..., Awaitable[Any]]] = None,
         data: Any = None,
         enabled: bool = True,
         visible: bool = True
@@ -58,6 +59,8 @@ class Menu:
         """
         self.title = title
         self.items = items or []
+        self._header = f"\n=== {title} ==="
+        self._sep = "=" * (len(title) + 8)
     
     def add_item(self, item: MenuItem) -> None:
         """
@@ -119,25 +122,24 @@ class Menu:
             Result of the selected action, or None if no action was selected
         """
         # Get visible and enabled items
-        items = self.get_visible_enabled_items()
+        items = [item for item in self.items if item.visible and item.enabled]
         
         if not items:
             print("No items available")
             return None
         
-        # Print the menu
-        print(f"\n=== {self.title} ===")
-        
-        for i, item in enumerate(items):
-            print(f"{i + 1}. {item.label}")
-        
-        print("0. Back")
-        print("=" * (len(self.title) + 8))
+        # Print the menu in a single write
+        lines = [self._header]
+        lines.extend(f"{i}. {item.label}" for i, item in enumerate(items, start=1))
+        lines.append("0. Back")
+        lines.append(self._sep)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
         
         # Get the user's choice
         while True:
             try:
-                choice = input(f"{prompt}: ")
+                choice = await get_input(prompt)
                 
                 if not choice or choice == "0":
                     return None
@@ -146,12 +148,13 @@ class Menu:
                 
                 if 0 <= index < len(items):
                     item = items[index]
+                    action = item.action
                     
-                    if item.action:
+                    if action:
                         if item.data is not None:
-                            return await item.action(item.data)
+                            return await action(item.data)
                         else:
-                            return await item.action()
+                            return await action()
                     
                     return None
                 
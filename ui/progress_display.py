@@ -1,26 +1,136 @@
 """
 Manages Rich-based progress display for RIPTIDAL.
 """
-from typing import Optional
-
-from rich.console import Console, Group # Import Console
-from rich.live import Live
-from rich.panel import Panel
-from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn, DownloadColumn, TransferSpeedColumn
-from rich.text import Text
+import asyncio
+import io
+import shutil
+import signal
+import sys
+import threading
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, List, Optional, Tuple
 
 from riptidal.core.download_models import DownloadProgress # Import from new location
 from riptidal.utils.logger import get_logger
 
+# Statuses that end a file download
+_TERMINAL_STATES = frozenset({"completed", "failed", "skipped"})
+# Statuses that count towards overall and album progress
+_PROGRESS_COUNTING_STATES = frozenset({"completed", "skipped"})
+
+# Rich is imported when the display is first built, not at module import
+if TYPE_CHECKING:
+    from rich.console import Console, ConsoleOptions, RenderableType, RenderResult
+    from rich.segment import Segment
+    from rich.live import Live
+    from rich.panel import Panel
+    from rich.progress import Progress
+    from rich.text import Text
+
+# Label and style shown for each download status
+_STATUS_STYLES = {
+    "pending": ("Pending", "yellow"),
+    "downloading": ("Downloading", "cyan"),
+    "completed": ("Completed", "green"),
+    "failed": ("Failed", "red"),
+    "skipped": ("Skipped", "yellow"),
+}
+# Prebuilt status fragments, shared by all progress managers
+_STATUS_TEXT: Dict[str, 'Text'] = {}
+
+
+class DirtyPanel:
+    """
+    Caches the rendered segments of a panel until its content changes.
+    
+    The cache is invalidated when ``version`` is bumped, when the optional
+    ``state`` callable returns a different value, or when the available size
+    changes.
+    """
+    def __init__(self, renderable: 'RenderableType', state: Optional[Callable[[], Hashable]] = None):
+        self.renderable = renderable
+        self.state = state
+        self.version = 0
+        self._cache_key: Optional[Tuple] = None
+        self._segments: List['Segment'] = []
+
+    def bump(self) -> None:
+        """Mark the panel content as changed."""
+        self.version += 1
+
+    def __rich_console__(self, console: 'Console', options: 'ConsoleOptions') -> 'RenderResult':
+        cache_key = (
+            self.version, self.state() if self.state else None,
+            options.min_width, options.max_width, options.height
+        )
+        if cache_key != self._cache_key:
+            self._segments = list(console.render(self.renderable, options))
+            self._cache_key = cache_key
+        yield from self._segments
+
+
+def _progress_state(progress: 'Progress') -> Tuple:
+    """Snapshot of the task fields shown by the overall and album progress bars."""
+    return tuple((task.description, task.completed, task.total, task.visible) for task in progress.tasks)
+
+
+class RenderableHolder:
+    """
+    Stable renderable for the live display.
+    
+    The album panel is switched on and off through ``show_album`` so the
+    layout can change without restarting the Live display.
+    """
+    def __init__(
+        self,
+        track_info_panel: 'RenderableType',
+        overall_panel: 'RenderableType',
+        album_panel: 'RenderableType',
+        file_panel: 'RenderableType'
+    ):
+        self.track_info_panel = track_info_panel
+        self.overall_panel = overall_panel
+        self.album_panel = album_panel
+        self.file_panel = file_panel
+        self.show_album = False
+
+    def __rich_console__(self, console: 'Console', options: 'ConsoleOptions') -> 'RenderResult':
+        yield self.track_info_panel
+        yield self.overall_panel
+        if self.show_album:
+            yield self.album_panel
+        yield self.file_panel
+
 
 class RichProgressManager:
     """
     Manages Rich components for displaying download progress.
     """
+    # Minimum time between screen refreshes, in seconds
+    REFRESH_INTERVAL = 0.1
+
     def __init__(self):
+        from rich.console import Console
+        from rich.panel import Panel
+        from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn, DownloadColumn, TransferSpeedColumn
+        from rich.text import Text
+
         self.logger = get_logger(__name__)
 
         self.track_info_text = Text(no_wrap=True)
+        self._labels = {
+            "track": Text("Track: ", style="bold"),
+            "video": Text("Video: ", style="bold"),
+            "artist": Text("Artist: ", style="bold"),
+            "album": Text("Album: ", style="bold"),
+            "quality_req": Text("Quality (Req): ", style="bold"),
+            "quality_act": Text("Quality (Act): ", style="bold"),
+            "status": Text("Status: ", style="bold"),
+            "error": Text("Error: ", style="bold red"),
+        }
+        if not _STATUS_TEXT:
+            _STATUS_TEXT.update(
+                (status, Text(label, style=style)) for status, (label, style) in _STATUS_STYLES.items()
+            )
         self.track_info_panel = Panel(self.track_info_text, title="Current Item", border_style="blue", width=80, height=8)
 
         self.overall_progress_display = Progress(
@@ -52,8 +162,23 @@ class RichProgressManager:
         )
         self.file_panel = Panel(self.file_progress_display, title="Current File", border_style="magenta", padding=(1,1))
         
-        self.console = Console(force_terminal=True, color_system="auto")
-        self.live: Optional[Live] = None 
+        # Only the file panel changes on every byte update; the others are re-rendered when their content changes
+        self._track_info_view = DirtyPanel(self.track_info_panel)
+        self._overall_view = DirtyPanel(self.overall_panel, lambda: _progress_state(self.overall_progress_display))
+        self._album_view = DirtyPanel(self.album_panel, lambda: _progress_state(self.album_progress_display))
+        self._holder = RenderableHolder(self._track_info_view, self._overall_view, self._album_view, self.file_panel)
+        
+        # Rich renders into a buffer that is written to the terminal in one go per frame
+        self._output = sys.stdout
+        self._frame_buffer = io.StringIO()
+        # The size is fixed here and updated on SIGWINCH instead of being queried on every render
+        terminal_size = shutil.get_terminal_size()
+        self.console = Console(
+            file=self._frame_buffer, force_terminal=True, color_system="auto", legacy_windows=False,
+            width=terminal_size.columns, height=terminal_size.lines
+        )
+        self._install_resize_handler()
+        self.live: Optional['Live'] = None 
 
         self.overall_task_id: Optional[int] = None
         self.album_task_id: Optional[int] = None
@@ -68,40 +193,61 @@ class RichProgressManager:
         self._current_album_title_for_progress: str = ""
         self._layout_has_album_panel: bool = False
 
-    def _create_layout_group(self, show_album_panel: bool) -> Group:
-        """Constructs the layout Group based on whether the album panel should be shown."""
-        renderables = [
-            self.track_info_panel,
-            self.overall_panel
-        ]
-        if show_album_panel:
-            if self.album_task_id is not None:
-                 self.album_progress_display.update(self.album_task_id, visible=True)
-            self.album_panel.visible = True
-            renderables.append(self.album_panel)
-        else:
-            if self.album_task_id is not None:
-                 self.album_progress_display.update(self.album_task_id, visible=False)
-            self.album_panel.visible = False
-            
-        renderables.append(self.file_panel)
-        return Group(*renderables)
+        self._dirty: bool = False
+        self._last_track_info_key: Optional[tuple] = None
+        self._last_file_bytes: int = 0
+        self._file_desc_key: Optional[tuple] = None
+        self._last_overall_state: Optional[tuple] = None
+        self._last_album_state: Optional[tuple] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+
+    def _install_resize_handler(self) -> None:
+        """Track terminal resizes where SIGWINCH is available (not on Windows)."""
+        if not hasattr(signal, "SIGWINCH") or threading.current_thread() is not threading.main_thread():
+            return
+        previous = signal.getsignal(signal.SIGWINCH)
+
+        def on_resize(signum, frame):
+            self._on_resize()
+            if callable(previous):
+                previous(signum, frame)
+
+        signal.signal(signal.SIGWINCH, on_resize)
+
+    def _on_resize(self) -> None:
+        """Update the console size after the terminal was resized."""
+        terminal_size = shutil.get_terminal_size()
+        if (terminal_size.columns, terminal_size.lines) != tuple(self.console.size):
+            self.console.size = (terminal_size.columns, terminal_size.lines)
+            self._dirty = True
 
     def _recreate_live_if_layout_changed(self, show_album_panel: bool):
-        if self.live is None or self._layout_has_album_panel != show_album_panel:
-            if self.live and self.live._started:
-                self.live.stop()
-            
-            current_layout_group = self._create_layout_group(show_album_panel=show_album_panel)
-            self.live = Live(current_layout_group, console=self.console, auto_refresh=False, transient=False, vertical_overflow="crop", screen=True)
-            self.live.start(refresh=True)
+        """
+        Start the live display if needed and switch the album panel on or off.
+        
+        Args:
+            show_album_panel: Whether the album panel should be shown
+        """
+        if self._layout_has_album_panel != show_album_panel:
+            if self.album_task_id is not None:
+                self.album_progress_display.update(self.album_task_id, visible=show_album_panel)
+            self._holder.show_album = show_album_panel
             self._layout_has_album_panel = show_album_panel
-            self.logger.debug(f"Live display recreated. Album panel shown: {show_album_panel}")
+            self.logger.debug(f"Live display layout changed. Album panel shown: {show_album_panel}")
+        
+        if self.live is None:
+            from rich.live import Live
+            self.live = Live(self._holder, console=self.console, auto_refresh=False, transient=False, vertical_overflow="crop", screen=True)
+            self.live.start(refresh=True)
+            self._write_frame()
+            self._ensure_flusher()
+            self.logger.debug("Live display created.")
 
     def set_batch_totals(self, total_tracks: int):
         """Sets the total number of original tracks for the current batch."""
         self._total_tracks = total_tracks
         self._completed_tracks = 0
+        self._last_overall_state = None
         if self.overall_task_id is not None:
             self.overall_progress_display.update(self.overall_task_id, total=self._total_tracks, completed=0, visible=True, description="Overall Progress")
         else:
@@ -130,17 +276,26 @@ class RichProgressManager:
         if self.file_task_id is not None:
             self.file_progress_display.update(self.file_task_id, visible=False)
             self.file_task_id = None
+        self._last_file_bytes = 0
+        self._last_track_info_key = None
+        self._last_overall_state = None
+        self._last_album_state = None
         
         self.track_info_text.plain = ""
+        self._mark_track_dirty()
         self._layout_has_album_panel = False
+        self._holder.show_album = False
+        self._cancel_flusher()
         if self.live and self.live._started:
             self.live.stop()
+            self._write_frame()
         self.live = None
 
 
-    async def _update_rich_track_info(self, progress: DownloadProgress):
+    def _update_rich_track_info(self, progress: DownloadProgress):
         """Helper to update the track info panel content."""
-        lines = []
+        from rich.text import Text
+
         if progress.is_video and progress.video_title:
             track_name_display = progress.video_title
         else:
@@ -149,37 +304,47 @@ class RichProgressManager:
         artist_name_display = progress.artist_names_str if progress.artist_names_str else "Unknown Artist"
         album_name_display = progress.album_title if progress.album_title else ""
         
+        # Assemble from prebuilt label fragments; dynamic values are appended as plain text
+        labels = self._labels
+        text = Text()
         if progress.is_video:
             self.track_info_panel.title = "Current Video"
-            lines.append(f"[bold]Video:[/] {track_name_display}")
+            text.append(labels["video"])
         else:
             self.track_info_panel.title = "Current Track"
-            lines.append(f"[bold]Track:[/] {track_name_display}")
-        lines.append(f"[bold]Artist:[/] {artist_name_display}")
+            text.append(labels["track"])
+        text.append(track_name_display)
+        text.append("\n")
+        text.append(labels["artist"])
+        text.append(artist_name_display)
         if album_name_display:
-            lines.append(f"[bold]Album:[/] {album_name_display}")
+            text.append("\n")
+            text.append(labels["album"])
+            text.append(album_name_display)
         if progress.requested_quality and progress.actual_quality:
             req_q_str = progress.requested_quality.name if hasattr(progress.requested_quality, 'name') else str(progress.requested_quality)
             act_q_str = progress.actual_quality.name if hasattr(progress.actual_quality, 'name') else str(progress.actual_quality)
-            lines.append(f"[bold]Quality (Req):[/] {req_q_str}")
-            lines.append(f"[bold]Quality (Act):[/] {act_q_str}")
+            text.append("\n")
+            text.append(labels["quality_req"])
+            text.append(req_q_str)
+            text.append("\n")
+            text.append(labels["quality_act"])
+            text.append(act_q_str)
         
-        status_map = {
-            "pending": "[yellow]Pending[/]",
-            "downloading": "[cyan]Downloading[/]",
-            "completed": "[green]Completed[/]",
-            "failed": "[red]Failed[/]",
-            "skipped": "[yellow]Skipped[/]"
-        }
-        status_str = status_map.get(progress.status, progress.status)
-        lines.append(f"[bold]Status:[/] {status_str}")
+        text.append("\n")
+        text.append(labels["status"])
+        text.append(_STATUS_TEXT.get(progress.status) or progress.status)
         if progress.error_message:
-            lines.append(f"[bold red]Error:[/] {progress.error_message}")
+            text.append("\n")
+            text.append(labels["error"])
+            text.append(progress.error_message)
 
-        new_text_content = Text.from_markup("\n".join(lines))
-        
-        self.track_info_panel.renderable = Text("") 
-        self.track_info_panel.renderable = new_text_content
+        self.track_info_panel.renderable = text
+        self._mark_track_dirty()
+
+    def _mark_track_dirty(self) -> None:
+        """Re-render the track info panel on the next refresh."""
+        self._track_info_view.bump()
 
     async def update_progress(self, progress: DownloadProgress) -> None:
         """
@@ -188,55 +353,42 @@ class RichProgressManager:
         Args:
             progress: Download progress information.
         """
-        await self._update_rich_track_info(progress)
+        status = progress.status
+        track_info_key = (
+            progress.track_id, progress.video_id, progress.track_title, progress.video_title,
+            progress.artist_names_str, progress.album_title, progress.album_index, progress.total_albums,
+            progress.total_tracks, status, progress.is_video, progress.is_album_track,
+            progress.is_original, progress.requested_quality, progress.actual_quality, progress.error_message
+        )
+        if track_info_key == self._last_track_info_key and self.live is not None:
+            # Only the byte counters moved, so the rest of the display is unchanged
+            if self._update_file_progress(progress):
+                self._mark_dirty()
+            return
+        self._last_track_info_key = track_info_key
 
-        if progress.status == "downloading":
-            display_title = progress.video_title if progress.is_video and progress.video_title else progress.track_title
-            display_title = display_title if display_title else "Unknown Title"
-            
-            if len(display_title) > 40:
-                display_title = display_title[:37] + "..."
-            
-            file_description = f"File: {display_title}"
-            if progress.is_video:
-                file_description = f"Video: {display_title}"
-            
-            if self.file_task_id is None:
-                self.file_task_id = self.file_progress_display.add_task(
-                    file_description,
-                    total=progress.total_bytes if progress.total_bytes is not None and progress.total_bytes > 0 else None,
-                    start=True
-                )
-            self.file_progress_display.update(
-                self.file_task_id,
-                completed=progress.downloaded_bytes,
-                total=progress.total_bytes if progress.total_bytes is not None and progress.total_bytes > 0 else None,
-                description=file_description,
-                visible=True
-            )
-        elif progress.status in ["completed", "failed", "skipped"]:
-            if self.file_task_id is not None:
-                final_total = progress.total_bytes if progress.total_bytes is not None and progress.total_bytes > 0 else progress.downloaded_bytes
-                self.file_progress_display.update(self.file_task_id, completed=progress.downloaded_bytes, total=final_total, visible=False)
-                self.file_task_id = None
+        self._update_rich_track_info(progress)
+        self._update_file_progress(progress)
 
-        is_album_track_for_progress = hasattr(progress, 'is_album_track') and progress.is_album_track
-        is_original_track = hasattr(progress, 'is_original') and progress.is_original
+        is_album_track_for_progress = progress.is_album_track
+        is_original_track = progress.is_original
 
-        if progress.status in ["completed", "skipped"] and (not hasattr(progress, '_counted_for_progress') or not progress._counted_for_progress):
+        if status in _PROGRESS_COUNTING_STATES and not progress._counted_for_progress:
             if is_album_track_for_progress:
                 self._album_tracks_completed += 1
                 if is_original_track: 
                     self._completed_tracks += 1
-                    self.logger.debug(f"Original album track '{progress.track_title}' {progress.status}. Overall: {self._completed_tracks}/{self._total_tracks}. Album: {self._album_tracks_completed}/{self._album_tracks_total}")
+                    self.logger.debug(f"Original album track '{progress.track_title}' {status}. Overall: {self._completed_tracks}/{self._total_tracks}. Album: {self._album_tracks_completed}/{self._album_tracks_total}")
             elif is_original_track: 
                 self._completed_tracks += 1
-                self.logger.debug(f"Original individual track '{progress.track_title}' {progress.status}. Overall: {self._completed_tracks}/{self._total_tracks}")
+                self.logger.debug(f"Original individual track '{progress.track_title}' {status}. Overall: {self._completed_tracks}/{self._total_tracks}")
             
-            setattr(progress, '_counted_for_progress', True)
+            progress._counted_for_progress = True
 
 
+        # Progress.update is skipped when the bar values haven't changed
         if self._total_tracks > 0:
+            overall_state = (self._completed_tracks, self._total_tracks)
             if self.overall_task_id is None:
                 self.overall_task_id = self.overall_progress_display.add_task(
                     "Overall Progress", 
@@ -244,50 +396,59 @@ class RichProgressManager:
                     completed=self._completed_tracks,
                     visible=True
                 )
-            else:
+            elif overall_state != self._last_overall_state:
                 self.overall_progress_display.update(
                     self.overall_task_id, 
                     completed=self._completed_tracks, 
                     total=self._total_tracks,
                     visible=True
                 )
-        elif self.overall_task_id is not None: 
+            self._last_overall_state = overall_state
+        elif self.overall_task_id is not None and self._last_overall_state is not None: 
             self.overall_progress_display.update(self.overall_task_id, visible=False)
+            self._last_overall_state = None
 
         
         if is_album_track_for_progress and progress.album_title and progress.total_tracks is not None:
             current_album_display_title = f"{progress.album_title} ({progress.album_index or '?'}/{progress.total_albums or '?'})"
             
             if self.album_task_id is None or self._current_album_title_for_progress != current_album_display_title:
-                if self.album_task_id is not None:
-                    self.album_progress_display.update(self.album_task_id, visible=False)
-                
                 self._current_album_title_for_progress = current_album_display_title
                 # Use the initial completed count if available
-                if hasattr(progress, 'album_initial_completed') and progress.album_initial_completed is not None:
+                if progress.album_initial_completed is not None:
                     self._album_tracks_completed = progress.album_initial_completed
                 else:
                     self._album_tracks_completed = 0
                 self._album_tracks_total = progress.total_tracks
                 
-                if progress.status in ["completed", "skipped"]: 
+                if status in _PROGRESS_COUNTING_STATES: 
                      self._album_tracks_completed += 1
                 
-                self.album_task_id = self.album_progress_display.add_task(
-                    f"Album: {current_album_display_title}",
-                    total=self._album_tracks_total, 
-                    completed=self._album_tracks_completed,
-                    visible=True,
-                    start=True
-                )
-            else: 
+                if self.album_task_id is None:
+                    self.album_task_id = self.album_progress_display.add_task(
+                        f"Album: {current_album_display_title}",
+                        total=self._album_tracks_total, 
+                        completed=self._album_tracks_completed,
+                        visible=True,
+                        start=True
+                    )
+                else:
+                    # Reuse the existing task for the next album
+                    self.album_progress_display.reset(
+                        self.album_task_id,
+                        total=self._album_tracks_total,
+                        completed=self._album_tracks_completed,
+                        description=f"Album: {current_album_display_title}",
+                        visible=True,
+                        start=True
+                    )
+            elif (self._album_tracks_completed, self._album_tracks_total) != self._last_album_state: 
                 self.album_progress_display.update(
                     self.album_task_id,
                     completed=self._album_tracks_completed,
-                    total=self._album_tracks_total,
-                    description=f"Album: {current_album_display_title}",
-                    visible=True
+                    total=self._album_tracks_total
                 )
+            self._last_album_state = (self._album_tracks_completed, self._album_tracks_total)
         elif self.album_task_id is not None and not is_album_track_for_progress : 
              self.album_progress_display.update(self.album_task_id, visible=False)
              self.album_task_id = None
@@ -298,27 +459,141 @@ class RichProgressManager:
         should_show_album_panel = not progress.is_video and progress.is_album_track
         
         self._recreate_live_if_layout_changed(should_show_album_panel)
+        self._mark_dirty()
 
+    def _update_file_progress(self, progress: DownloadProgress) -> bool:
+        """
+        Update the current file progress bar.
+        
+        Byte updates smaller than 0.5% of the file (or 64 KiB) are skipped since
+        they don't visibly move the bar.
+        
+        Args:
+            progress: Download progress information.
+            
+        Returns:
+            True if the progress bar was updated, False if the update was skipped
+        """
+        status = progress.status
+        if status == "downloading":
+            total = progress.total_bytes if progress.total_bytes is not None and progress.total_bytes > 0 else None
+            if self.file_task_id is not None:
+                delta = progress.downloaded_bytes - self._last_file_bytes
+                if 0 <= delta < max((total or 0) / 200, 65536) and progress.downloaded_bytes != total:
+                    return False
+            
+            desc_key = (progress.is_video, progress.video_title, progress.track_title)
+            if self.file_task_id is not None and desc_key == self._file_desc_key:
+                # Same file, so only the byte counts change
+                self.file_progress_display.update(self.file_task_id, completed=progress.downloaded_bytes, total=total)
+                self._last_file_bytes = progress.downloaded_bytes
+                return True
+            self._file_desc_key = desc_key
+            
+            display_title = progress.video_title if progress.is_video and progress.video_title else progress.track_title
+            display_title = display_title if display_title else "Unknown Title"
+            
+            if len(display_title) > 40:
+                display_title = display_title[:37] + "..."
+            
+            file_description = f"File: {display_title}"
+            if progress.is_video:
+                file_description = f"Video: {display_title}"
+            
+            if self.file_task_id is None:
+                self.file_task_id = self.file_progress_display.add_task(
+                    file_description,
+                    total=total,
+                    start=True
+                )
+            self.file_progress_display.update(
+                self.file_task_id,
+                completed=progress.downloaded_bytes,
+                total=total,
+                description=file_description,
+                visible=True
+            )
+            self._last_file_bytes = progress.downloaded_bytes
+            return True
+        elif status in _TERMINAL_STATES:
+            if self.file_task_id is not None:
+                final_total = progress.total_bytes if progress.total_bytes is not None and progress.total_bytes > 0 else progress.downloaded_bytes
+                self.file_progress_display.update(self.file_task_id, completed=progress.downloaded_bytes, total=final_total, visible=False)
+                self.file_task_id = None
+                self._last_file_bytes = 0
+                return True
+        return False
+
+    def _mark_dirty(self) -> None:
+        """Schedule a coalesced refresh of the live display."""
+        self._dirty = True
+        self._ensure_flusher()
+
+    def _ensure_flusher(self) -> None:
+        """Start the refresh task if it isn't running and an event loop is available."""
+        if self._flusher_task is None or self._flusher_task.done():
+            try:
+                self._flusher_task = asyncio.get_running_loop().create_task(self._flush_loop())
+            except RuntimeError:
+                pass
+
+    async def _flush_loop(self) -> None:
+        """Refresh the live display at most once per REFRESH_INTERVAL while it has pending changes."""
+        while True:
+            await asyncio.sleep(self.REFRESH_INTERVAL)
+            if self._dirty and self.live and self.live._started:
+                self._dirty = False
+                self.live.refresh()
+            # Also picks up output printed while the display is redirected
+            self._write_frame()
+
+    def _write_frame(self) -> None:
+        """Write everything Rich rendered since the last call to the terminal in a single write."""
+        data = self._frame_buffer.getvalue()
+        if data:
+            self._frame_buffer.seek(0)
+            self._frame_buffer.truncate()
+            self._output.write(data)
+            self._output.flush()
+
+    def refresh(self) -> None:
+        """Refresh the live display immediately."""
         if self.live and self.live._started:
+            self._dirty = False
             self.live.refresh()
+            self._write_frame()
 
+    def _cancel_flusher(self) -> None:
+        """Cancel the refresh task and drop pending changes."""
+        if self._flusher_task is not None:
+            self._flusher_task.cancel()
+            self._flusher_task = None
+        self._dirty = False
 
     def start_display(self, initial_message: str = "Initializing..."):
         """Starts the live display."""
         self.track_info_text.plain = initial_message
+        self._mark_track_dirty()
         self._recreate_live_if_layout_changed(show_album_panel=False)
         self.logger.debug("Rich Live display started/updated.")
 
+    @property
+    def is_stopped(self) -> bool:
+        """Whether the live display is currently inactive."""
+        return self.live is None or not self.live._started
+
     def stop_display(self):
         """Stops the live display if it's active."""
         if self.live and self.live._started: 
             self.live.stop()
+            self._write_frame()
             self.logger.debug("Rich Live display stopped.")
         self.reset_progress_state()
 
     def clear_current_track_info(self):
         """Clears the current track information panel."""
         self.track_info_text.plain = ""
+        self._mark_track_dirty()
 
     def set_overall_progress_description(self, description: str):
         """Sets the description for the overall progress bar."""
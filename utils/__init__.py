@@ -4,11 +4,35 @@ Utils package for RIPTIDAL.
 This package provides utility functions for the application.
 """
 
+from typing import Any
+
 from riptidal.utils.logger import setup_logger, get_logger
-from riptidal.utils.paths import (
-    get_config_dir, get_data_dir, get_cache_dir, get_default_download_dir,
-    sanitize_filename, format_path
-)
+
+# Path helpers are loaded on first access (PEP 562)
+_PATHS_EXPORTS = frozenset({
+    'get_config_dir', 'get_data_dir', 'get_cache_dir', 'get_default_download_dir',
+    'sanitize_filename', 'format_path',
+})
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve lazily exported path helpers.
+    
+    Args:
+        name: Attribute name
+        
+    Returns:
+        The requested helper from riptidal.utils.paths
+    """
+    if name in _PATHS_EXPORTS:
+        from riptidal.utils import paths
+        value = getattr(paths, name)
+        # Cache on the package so later lookups skip __getattr__
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'setup_logger',
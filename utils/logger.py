@@ -30,11 +30,19 @@ def setup_logger(
     """
     # Create root logger
     root_logger = logging.getLogger()
+    
+    # Nothing to do if the same configuration is already installed
+    stream = stream or sys.stdout
+    config_key = (level, str(log_file) if log_file else None, file_level, format_string, id(stream))
+    if root_logger.handlers and getattr(root_logger, "_riptidal_logger_key", None) == config_key:
+        return
+    
     root_logger.setLevel(logging.DEBUG)  # Capture all logs at the root level
     
     # Remove existing handlers to avoid duplicates
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+        handler.close()
     
     # Set default format if not provided
     if format_string is None:
@@ -43,7 +51,7 @@ def setup_logger(
     formatter = logging.Formatter(format_string)
     
     # Console handler
-    console_handler = logging.StreamHandler(stream or sys.stdout)
+    console_handler = logging.StreamHandler(stream)
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
     root_logger.addHandler(console_handler)
@@ -53,7 +61,8 @@ def setup_logger(
         file_path = Path(log_file)
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
-        file_handler = logging.FileHandler(file_path, encoding="utf-8")
+        # The file is opened on the first record written to it
+        file_handler = logging.FileHandler(file_path, encoding="utf-8", delay=True)
         file_handler.setLevel(file_level or logging.DEBUG)  # Always log DEBUG to file
         file_handler.setFormatter(formatter)
         root_logger.addHandler(file_handler)
@@ -62,6 +71,8 @@ def setup_logger(
     logging.getLogger("requests").setLevel(logging.WARNING)
     logging.getLogger("urllib3").setLevel(logging.WARNING)
     
+    root_logger._riptidal_logger_key = config_key
+    
     # Log the setup
     logger = logging.getLogger(__name__)
     logger.debug(f"Logging initialized at level {logging.getLevelName(level)}")
@@ -9,12 +9,28 @@ import os
 import platform
 import re
 import string
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Union, Any
+from typing import Dict, Optional, Set, Union, Any
 
 
 from riptidal.utils.logger import get_logger
 
+# Replaces characters that are invalid in filenames and drops C0/C1 control characters
+_SANITIZE_TABLE = str.maketrans(
+    {**{c: '_' for c in '<>:"/\\|?*'}, **{c: None for c in [*range(0x00, 0x20), *range(0x7f, 0xa0)]}}
+)
+
+_PLACEHOLDER_RE = re.compile(r'\{[^{}]*\}')
+_SEP_RE = re.compile(r'[/\\]+')
+# Escaped so the Windows separator isn't read as a regex escape
+_SEP_REPL = os.path.sep.replace('\\', '\\\\')
+
+# Directories already created (and, for the data directory, checked for writability) in this process
+_ENSURED_DIRS: Set[Path] = set()
+
+
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """
     Get the root directory of the project with enhanced error handling.
@@ -28,14 +44,14 @@ def get_project_root() -> Path:
         # The module file is in utils/paths.py
         # So we need to go up one level to get to the project root
         current_file = Path(__file__).resolve()  # Use resolve() for absolute path
-        logger.debug(f"Current file path: {current_file}")
+        logger.debug("Current file path: %s", current_file)
         
         # Verify the expected structure
         if current_file.parent.name != "utils":
             logger.warning(f"Unexpected directory structure: {current_file.parent.name} is not 'utils'")
         
         project_root = current_file.parent.parent
-        logger.debug(f"Calculated project root: {project_root}")
+        logger.debug("Calculated project root: %s", project_root)
         
         # Verify this looks like a project root by checking for common files/directories
         common_markers = ["main.py", "README.md", "pyproject.toml", "requirements.txt"]
@@ -50,7 +66,7 @@ def get_project_root() -> Path:
                 logger.info(f"Using alternative project root: {alt_root} (found markers: {alt_markers})")
                 return alt_root
         else:
-            logger.debug(f"Verified project root with markers: {found_markers}")
+            logger.debug("Verified project root with markers: %s", found_markers)
         
         return project_root
     except Exception as e:
@@ -61,6 +77,22 @@ def get_project_root() -> Path:
         return cwd
 
 
+def _ensure(path: Path) -> Path:
+    """
+    Create a directory, probing the filesystem only once per process.
+    
+    Args:
+        path: Directory to create
+        
+    Returns:
+        The same path
+    """
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+    return path
+
+
 def get_config_dir() -> Path:
     """
     Get the configuration directory for the application.
@@ -69,9 +101,7 @@ def get_config_dir() -> Path:
         Path to the configuration directory
     """
     # Store config in a .config directory in the project root
-    config_dir = get_project_root() / ".config"
-    config_dir.mkdir(parents=True, exist_ok=True)
-    return config_dir
+    return _ensure(get_project_root() / ".config")
 
 
 def get_data_dir() -> Path:
@@ -86,16 +116,16 @@ def get_data_dir() -> Path:
     try:
         # Get the project root
         project_root = get_project_root()
-        logger.debug(f"Project root: {project_root}")
         
         # Store data in a .data directory in the project root
         data_dir = project_root / ".data"
-        logger.debug(f"Data directory path: {data_dir}")
+        if data_dir in _ENSURED_DIRS:
+            return data_dir
+        logger.debug("Data directory path: %s", data_dir)
         
         # Create the directory with explicit error handling
         try:
             data_dir.mkdir(parents=True, exist_ok=True)
-            logger.debug(f"Created or verified data directory: {data_dir}")
         except PermissionError:
             logger.error(f"Permission denied when creating data directory: {data_dir}")
             # Try to create in user's home directory as fallback
@@ -112,15 +142,12 @@ def get_data_dir() -> Path:
             logger.error(f"Data directory does not exist after creation attempt: {data_dir}")
             raise IOError(f"Failed to create data directory: {data_dir}")
         
-        # Check if directory is writable by creating a test file
-        test_file = data_dir / ".write_test"
-        try:
-            with open(test_file, "w") as f:
-                f.write("test")
-            test_file.unlink()  # Remove the test file
-            logger.debug(f"Verified data directory is writable: {data_dir}")
-        except Exception as e:
-            logger.error(f"Data directory is not writable: {data_dir}, error: {str(e)}")
+        # Check if directory is writable
+        if os.access(data_dir, os.W_OK):
+            logger.debug("Verified data directory is writable: %s", data_dir)
+            _ENSURED_DIRS.add(data_dir)
+        else:
+            logger.error(f"Data directory is not writable: {data_dir}")
             # Try to use home directory as fallback
             home_data_dir = Path.home() / ".riptidal_data"
             logger.info(f"Using fallback data directory: {home_data_dir}")
@@ -146,9 +173,7 @@ def get_cache_dir() -> Path:
         Path to the cache directory
     """
     # Store cache in a .cache directory in the project root
-    cache_dir = get_project_root() / ".cache"
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    return cache_dir
+    return _ensure(get_project_root() / ".cache")
 
 
 def get_default_download_dir() -> Path:
@@ -159,11 +184,10 @@ def get_default_download_dir() -> Path:
         Path to the default download directory
     """
     # Store downloads in a Downloads directory in the project root
-    download_dir = get_project_root() / "Downloads"
-    download_dir.mkdir(parents=True, exist_ok=True)
-    return download_dir
+    return _ensure(get_project_root() / "Downloads")
 
 
+@lru_cache(maxsize=256)
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize a filename to ensure it's valid across different operating systems.
@@ -174,18 +198,9 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         A sanitized filename
     """
-    # Replace invalid characters with underscores
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
-    
-    # Remove C0 and C1 control characters, but allow other Unicode characters.
-    # C0 controls: U+0000 to U+001F
-    # C1 controls: U+007F to U+009F (DEL is U+007F)
-    # We'll create a regex to remove these.
-    # This regex matches characters in the C0 range (0-31) and C1 range (127-159).
-    control_chars_re = re.compile(r'[\x00-\x1f\x7f-\x9f]')
-    filename = control_chars_re.sub('', filename)
+    # Replace invalid characters with underscores and remove C0 (U+0000-U+001F)
+    # and C1 (U+007F-U+009F) control characters in a single pass
+    filename = filename.translate(_SANITIZE_TABLE)
     
     # Trim leading/trailing whitespace and dots
     filename = filename.strip(' .')
@@ -196,16 +211,27 @@ def sanitize_filename(filename: str) -> str:
     
     # Ensure the filename isn't too long (255 is the limit on many filesystems)
     if len(filename) > 250:
-        # Keep the extension if present
-        parts = filename.rsplit('.', 1)
-        if len(parts) > 1 and len(parts[1]) <= 10:
-            filename = parts[0][:250 - len(parts[1]) - 1] + '.' + parts[1]
+        # Keep the extension if present (only extensions up to 10 characters count)
+        dot = filename.rfind('.', max(0, len(filename) - 11))
+        if dot != -1:
+            ext = filename[dot:]
+            filename = filename[:250 - len(ext)] + ext
         else:
             filename = filename[:250]
     
     return filename
 
 
+class _SanitizingDict(dict):
+    """Mapping for str.format_map that sanitizes string values and blanks missing ones."""
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key)
+        if value is None:
+            return ""
+        return sanitize_filename(value) if isinstance(value, str) else value
+
+
 def format_path(
     template: str, 
     data: Dict[str, Any], 
@@ -222,22 +248,28 @@ def format_path(
     Returns:
         A formatted Path object
     """
-    # Replace placeholders in the template
-    formatted = template
-    for key, value in data.items():
-        if value is not None:
-            placeholder = f"{{{key}}}"
-            if placeholder in formatted:
-                # Sanitize the value if it's a string
-                if isinstance(value, str):
-                    value = sanitize_filename(value)
-                formatted = formatted.replace(placeholder, str(value))
-    
-    # Remove any remaining placeholders
-    formatted = re.sub(r'{[^{}]*}', '', formatted)
+    # Fill placeholders in a single pass; unknown placeholders become empty
+    try:
+        formatted = template.format_map(_SanitizingDict(data))
+    except (ValueError, IndexError, AttributeError, KeyError):
+        # Not a valid format string (e.g. stray braces), substitute placeholders one by one
+        formatted = template
+        for key, value in data.items():
+            if '{' not in formatted:
+                break
+            if value is not None:
+                placeholder = f"{{{key}}}"
+                if placeholder in formatted:
+                    # Sanitize the value if it's a string
+                    if isinstance(value, str):
+                        value = sanitize_filename(value)
+                    formatted = formatted.replace(placeholder, str(value))
+        
+        # Remove any remaining placeholders
+        formatted = _PLACEHOLDER_RE.sub('', formatted)
     
     # Clean up multiple slashes and normalize the path
-    formatted = re.sub(r'[/\\]+', os.path.sep, formatted)
+    formatted = _SEP_RE.sub(_SEP_REPL, formatted)
     
     # Remove leading/trailing slashes
     formatted = formatted.strip(os.path.sep)